@@ -0,0 +1,53 @@
+"""Add indexes for sample lookup and latest-submission queries.
+
+Revision ID: 0005_sample_lookup_indexes
+Revises: 0004_qc_reads_assembly_refs
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0005_sample_lookup_indexes"
+down_revision = "0004_qc_reads_assembly_refs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on the live sample tables
+    with op.get_context().autocommit_block():
+        # Serves "latest submission for sample" (ORDER BY updated_at DESC LIMIT 1)
+        op.create_index(
+            "idx_sample_submission_sample_updated",
+            "sample_submission",
+            ["sample_id", sa.text("updated_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # bpa_sample_id lookups during bulk import also cover specimen samples,
+        # which the partial unique index uq_derived_bpa_sample_id does not.
+        op.create_index(
+            "idx_sample_bpa_sample_id",
+            "sample",
+            ["bpa_sample_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sample_bpa_sample_id",
+            table_name="sample",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_sample_submission_sample_updated",
+            table_name="sample_submission",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,38 @@
+"""Add index for latest experiment submission lookups.
+
+Revision ID: 0006_exp_submission_latest_idx
+Revises: 0005_sample_lookup_indexes
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0006_exp_submission_latest_idx"
+down_revision = "0005_sample_lookup_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on experiment_submission
+    with op.get_context().autocommit_block():
+        # Serves "latest submission for experiment" (ORDER BY updated_at DESC LIMIT 1)
+        op.create_index(
+            "idx_experiment_submission_experiment_updated",
+            "experiment_submission",
+            ["experiment_id", sa.text("updated_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_experiment_submission_experiment_updated",
+            table_name="experiment_submission",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
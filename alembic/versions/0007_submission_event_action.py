@@ -0,0 +1,38 @@
+"""Store submission_event.action as a native enum.
+
+Revision ID: 0007_submission_event_action
+Revises: 0006_exp_submission_latest_idx
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0007_submission_event_action"
+down_revision = "0006_exp_submission_latest_idx"
+branch_labels = None
+depends_on = None
+
+ACTIONS = ("claimed", "accepted", "rejected", "released", "expired", "progress")
+_ACTION_LIST = ", ".join(f"'{action}'" for action in ACTIONS)
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE TYPE submission_event_action AS ENUM ({_ACTION_LIST})")
+    # The enum now carries the allowed values, so the CHECK is redundant
+    op.execute(
+        "ALTER TABLE submission_event DROP CONSTRAINT IF EXISTS submission_event_action_check"
+    )
+    op.execute(
+        "ALTER TABLE submission_event "
+        "ALTER COLUMN action TYPE submission_event_action "
+        "USING action::submission_event_action"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE submission_event ALTER COLUMN action TYPE TEXT USING action::text")
+    op.execute(
+        "ALTER TABLE submission_event "
+        f"ADD CONSTRAINT submission_event_action_check CHECK (action IN ({_ACTION_LIST}))"
+    )
+    op.execute("DROP TYPE submission_event_action")
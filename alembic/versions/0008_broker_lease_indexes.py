@@ -0,0 +1,55 @@
+"""Add partial indexes for the broker lease-expiry sweeps.
+
+Revision ID: 0008_broker_lease_indexes
+Revises: 0007_submission_event_action
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0008_broker_lease_indexes"
+down_revision = "0007_submission_event_action"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on the live broker tables
+    with op.get_context().autocommit_block():
+        # Serves "status = 'submitting' AND lock_expires_at <= now()" and
+        # status = 'ready' claims; only in-flight rows are indexed.
+        op.create_index(
+            "idx_experiment_submission_claimable",
+            "experiment_submission",
+            ["status", "lock_expires_at"],
+            postgresql_where=sa.text("status IN ('ready', 'submitting')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Serves "status = 'processing' AND lock_expires_at < now()"
+        op.create_index(
+            "idx_submission_attempt_active",
+            "submission_attempt",
+            ["status", "lock_expires_at"],
+            postgresql_where=sa.text("status = 'processing'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_submission_attempt_active",
+            table_name="submission_attempt",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_experiment_submission_claimable",
+            table_name="experiment_submission",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
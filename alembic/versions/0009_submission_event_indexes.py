@@ -0,0 +1,51 @@
+"""Cover the per-attempt submission event lookup with one index.
+
+Revision ID: 0009_submission_event_indexes
+Revises: 0008_broker_lease_indexes
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0009_submission_event_indexes"
+down_revision = "0008_broker_lease_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on the live event log
+    with op.get_context().autocommit_block():
+        # Serves "submission_id WHERE attempt_id = ? AND entity_type = ?" as an
+        # index-only scan; its leading column also covers plain attempt_id lookups.
+        op.create_index(
+            "idx_submission_event_attempt_entity",
+            "submission_event",
+            ["attempt_id", "entity_type"],
+            postgresql_include=["submission_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submission_event_attempt",
+            table_name="submission_event",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_submission_event_attempt",
+            "submission_event",
+            ["attempt_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_submission_event_attempt_entity",
+            table_name="submission_event",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,44 @@
+"""Add claimable partial indexes to the remaining submission tables.
+
+Revision ID: 0010_claimable_indexes
+Revises: 0009_submission_event_indexes
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0010_claimable_indexes"
+down_revision = "0009_submission_event_indexes"
+branch_labels = None
+depends_on = None
+
+# Same shape as idx_experiment_submission_claimable (0008): only in-flight rows
+# are indexed, so lease-expiry sweeps scan the active queue rather than history.
+_TABLES = ("sample_submission", "qc_read_submission", "project_submission")
+
+
+def upgrade() -> None:
+    # Build without blocking writes on the live submission tables
+    with op.get_context().autocommit_block():
+        for table in _TABLES:
+            op.create_index(
+                f"idx_{table}_claimable",
+                table,
+                ["status", "lock_expires_at"],
+                postgresql_where=sa.text("status IN ('ready', 'submitting')"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(_TABLES):
+            op.drop_index(
+                f"idx_{table}_claimable",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
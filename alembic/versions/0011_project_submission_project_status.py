@@ -0,0 +1,37 @@
+"""Index project_submission by project and status.
+
+Revision ID: 0011_project_submission_status
+Revises: 0010_claimable_indexes
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0011_project_submission_status"
+down_revision = "0010_claimable_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on the live submission table
+    with op.get_context().autocommit_block():
+        # project_id had no index of its own; this serves per-project claims and
+        # draft lookups, and the ON DELETE CASCADE scan from project.
+        op.create_index(
+            "idx_project_submission_project_status",
+            "project_submission",
+            ["project_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_project_submission_project_status",
+            table_name="project_submission",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
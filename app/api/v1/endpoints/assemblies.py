@@ -4,13 +4,14 @@ from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.api.v1.endpoints.qc_reads import _build_prepared_payload
 from app.core.dependencies import get_current_active_user, get_db
 from app.core.errors import AppError
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
+from app.db.loading import list_load_options
 from app.models.assembly import (
     Assembly,
     AssemblyFile,
@@ -81,6 +82,31 @@ def _organism_taxon_id(organism: Any) -> int:
     return organism.taxon_id if hasattr(organism, "taxon_id") else organism.tax_id
 
 
+def _pipeline_input_files(db: Session, taxon_id: int) -> Dict[str, str]:
+    """Map read file names to bioplatforms URLs across an organism's samples.
+
+    Experiments and reads are selectin-loaded, so the walk costs three queries
+    however many samples and experiments the organism has.
+    """
+    samples = (
+        db.query(Sample)
+        .options(
+            *list_load_options(
+                selectinload(Sample.exp_sample_records).selectinload(Experiment.reads)
+            )
+        )
+        .filter(Sample.taxon_id == taxon_id)
+        .all()
+    )
+    files: Dict[str, str] = {}
+    for sample in samples:
+        for experiment in sample.exp_sample_records:
+            for read in experiment.reads:
+                if read.file_name and read.bioplatforms_url:
+                    files[read.file_name] = read.bioplatforms_url
+    return files
+
+
 def _build_sample_metadata_by_id(
     db: Session, experiments: List[Experiment]
 ) -> Dict[str, Dict[str, Any]]:
@@ -250,37 +276,13 @@ def get_pipeline_inputs(
         )
 
     organism_taxon_id = _organism_taxon_id(organism)
-    samples = db.query(Sample).filter(Sample.taxon_id == organism_taxon_id).all()
-    if not samples:
-        return [
-            {
-                "scientific_name": organism.scientific_name,
-                "taxon_id": organism_taxon_id,
-                "files": {},
-            }
-        ]
-
-    result = []
-    files_dict = {}
-
-    for sample in samples:
-        experiments = db.query(Experiment).filter(Experiment.sample_id == sample.id).all()
-        for experiment in experiments:
-            reads = db.query(Read).filter(Read.experiment_id == experiment.id).all()
-            if reads is None:
-                continue
-            for read in reads:
-                if read.file_name and read.bioplatforms_url:
-                    files_dict[read.file_name] = read.bioplatforms_url
-
-    result.append(
+    return [
         {
             "scientific_name": organism.scientific_name,
             "taxon_id": organism_taxon_id,
-            "files": files_dict,
+            "files": _pipeline_input_files(db, organism_taxon_id),
         }
-    )
-    return result
+    ]
 
 
 @router.get("/pipeline-inputs-by-tax-id")
@@ -303,21 +305,8 @@ def get_pipeline_inputs_by_taxon_id(
     if not organism:
         return {taxon_id: {}}
 
-    result = {taxon_id: {"scientific_name": organism.scientific_name, "files": {}}}
-    organism_taxon_id = _organism_taxon_id(organism)
-    samples = db.query(Sample).filter(Sample.taxon_id == organism_taxon_id).all()
-    if not samples:
-        return result
-
-    for sample in samples:
-        experiments = db.query(Experiment).filter(Experiment.sample_id == sample.id).all()
-        for experiment in experiments:
-            reads = db.query(Read).filter(Read.experiment_id == experiment.id).all()
-            for read in reads:
-                if read.file_name and read.bioplatforms_url:
-                    result[taxon_id]["files"][read.file_name] = read.bioplatforms_url
-
-    return result
+    files = _pipeline_input_files(db, _organism_taxon_id(organism))
+    return {taxon_id: {"scientific_name": organism.scientific_name, "files": files}}
 
 
 @router.get("/manifest/{taxon_id}")
@@ -740,7 +729,7 @@ def delete_assembly(
 @router.get("/submission/", response_model=List[AssemblySubmissionSchema])
 def read_assembly_submissions(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     status: Optional[SubmissionStatus] = Query(None, description="Filter by submission status"),
     assembly_id: Optional[UUID] = Query(None, description="Filter by assembly ID"),
     current_user: User = Depends(get_current_active_user),
@@ -752,7 +741,7 @@ def read_assembly_submissions(
         query = db.query(AssemblySubmission)
         if status:
             query = query.filter(AssemblySubmission.status == status.value)
-        submissions = apply_pagination(query, pagination).all()
+        submissions = apply_pagination(query, pagination, key=AssemblySubmission.id).all()
     return submissions
 
 
@@ -7,7 +7,12 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import authenticate_user, get_current_user
-from app.core.security import create_access_token, generate_refresh_token, hash_token
+from app.core.security import (
+    create_access_token,
+    generate_refresh_token,
+    hash_token,
+    legacy_hash_token,
+)
 from app.core.settings import settings
 from app.db.session import get_db
 from app.models.token import RefreshToken
@@ -86,12 +91,13 @@ def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)) -> Any
     Raises:
         HTTPException: If refresh token is invalid or expired
     """
-    # Find the token in the database
-    token_hash = hash_token(request.refresh_token)
+    # Find the token in the database. Tokens issued before the switch to
+    # BLAKE2b are still stored as SHA-256 and are rehashed on rotation below.
+    token_hashes = (hash_token(request.refresh_token), legacy_hash_token(request.refresh_token))
     stored_token = (
         db.query(RefreshToken)
         .filter(
-            RefreshToken.token_hash == token_hash,
+            RefreshToken.token_hash.in_(token_hashes),
             RefreshToken.expires_at > datetime.now(timezone.utc),
             RefreshToken.revoked == False,
         )
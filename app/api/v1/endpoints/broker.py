@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import func, or_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.core.dependencies import get_current_active_user, get_db, has_role
 from app.core.policy import policy
@@ -2512,10 +2512,13 @@ def expire_stale_leases(db: Session) -> Dict[str, int]:
     """
     now = datetime.now(timezone.utc)
     expired_counts = {"samples": 0, "experiments": 0, "reads": 0, "projects": 0}
+    # Rows are only reset here, so load just the columns the loop reads and leave
+    # the JSONB payloads in TOAST; the status/lease assignments are written blind.
 
     # Expire sample submissions
     sample_rows = (
         db.query(SampleSubmission)
+        .options(load_only(SampleSubmission.id, SampleSubmission.attempt_id))
         .filter(
             SampleSubmission.status == "submitting",
             SampleSubmission.lock_expires_at.isnot(None),
@@ -2543,6 +2546,7 @@ def expire_stale_leases(db: Session) -> Dict[str, int]:
     # Expire experiment submissions
     exp_rows = (
         db.query(ExperimentSubmission)
+        .options(load_only(ExperimentSubmission.id, ExperimentSubmission.attempt_id))
         .filter(
             ExperimentSubmission.status == "submitting",
             ExperimentSubmission.lock_expires_at.isnot(None),
@@ -2570,6 +2574,7 @@ def expire_stale_leases(db: Session) -> Dict[str, int]:
     # Expire qc_read submissions
     read_rows = (
         db.query(QcReadSubmission)
+        .options(load_only(QcReadSubmission.id, QcReadSubmission.attempt_id))
         .filter(
             QcReadSubmission.status == "submitting",
             QcReadSubmission.lock_expires_at.isnot(None),
@@ -2597,6 +2602,7 @@ def expire_stale_leases(db: Session) -> Dict[str, int]:
     # Expire project submissions
     proj_rows = (
         db.query(ProjectSubmission)
+        .options(load_only(ProjectSubmission.id, ProjectSubmission.attempt_id))
         .filter(
             ProjectSubmission.status == "submitting",
             ProjectSubmission.lock_expires_at.isnot(None),
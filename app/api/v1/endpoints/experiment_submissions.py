@@ -54,7 +54,7 @@ def read_experiment_submissions(
 
 @router.get("/by-experiment-attr", response_model=List[ExperimentSubmissionSchema])
 @policy("experiment_submissions:read")
-async def get_experiment_submission_by_experiment_attr(
+def get_experiment_submission_by_experiment_attr(
     db: Session = Depends(get_db),
     bpa_package_id: Optional[str] = Query(None, description="Filter by bpa_package_id"),
     experiment_id: Optional[str] = Query(None, description="Filter by experiment_id"),
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, pagination_params
+from app.core.pagination import Pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.user import User
 from app.schemas.bulk_import import BulkImportResponse, BulkImportResponseExperiments
@@ -20,7 +20,7 @@ router = APIRouter()
 @router.get("/", response_model=List[ExperimentSchema])
 def read_experiments(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     sample_id: Optional[UUID] = Query(None, description="Filter by sample ID"),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
@@ -29,7 +29,11 @@ def read_experiments(
     """
     # All users can read experiments
     return experiment_service.list_experiments(
-        db, skip=pagination.offset, limit=pagination.limit, sample_id=sample_id
+        db,
+        skip=pagination.offset,
+        limit=pagination.limit,
+        after=pagination.after,
+        sample_id=sample_id,
     )
 
 
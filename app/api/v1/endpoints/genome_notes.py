@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, pagination_params
+from app.core.pagination import Pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.genome_note import GenomeNote
 from app.models.user import User
@@ -24,7 +24,7 @@ router = APIRouter()
 @router.get("/", response_model=List[GenomeNoteSchema])
 def read_genome_notes(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     taxon_id: Optional[int] = Query(None, description="Filter by organism taxon ID"),
     assembly_id: Optional[UUID] = Query(None, description="Filter by assembly ID"),
     is_published: Optional[bool] = Query(None, description="Filter by publication status"),
@@ -38,6 +38,7 @@ def read_genome_notes(
         db,
         skip=pagination.offset,
         limit=pagination.limit,
+        after=pagination.after,
         taxon_id=taxon_id,
         assembly_id=assembly_id,
         is_published=is_published,
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from app.core.dependencies import get_current_active_user, get_db
 from app.core.pagination import Pagination, apply_pagination, pagination_params
@@ -34,7 +34,7 @@ def read_organisms(
     Retrieve organisms.
     """
     # All users can read organisms
-    query = db.query(Organism)
+    query = db.query(Organism).options(undefer(Organism.bpa_json))
     query = apply_pagination(query, pagination)
     return query.all()
 
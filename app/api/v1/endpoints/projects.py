@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.project import Project
 from app.models.user import User
@@ -23,14 +23,14 @@ router = APIRouter()
 @router.get("/", response_model=List[ProjectSchema])
 def read_projects(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve projects.
     """
     # All users can read projects
-    projects = apply_pagination(db.query(Project), pagination).all()
+    projects = apply_pagination(db.query(Project), pagination, key=Project.id).all()
     return projects
 
 
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.qc_read import QcRead, QcReadAssembly, QcReadFile, QcReadSubmission
 from app.models.user import User
@@ -40,7 +40,7 @@ def _build_prepared_payload(qc_read: QcRead, files: list[QcReadFile]) -> dict:
 @router.get("/", response_model=List[QcReadOut])
 def list_qc_reads(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     experiment_id: Optional[UUID] = Query(None, description="Filter by experiment ID"),
     assembly_id: Optional[UUID] = Query(None, description="Filter by assembly ID"),
     current_user: User = Depends(get_current_active_user),
@@ -51,7 +51,7 @@ def list_qc_reads(
         query = query.filter(QcRead.experiment_id == experiment_id)
     if assembly_id:
         query = query.join(QcReadAssembly).filter(QcReadAssembly.assembly_id == assembly_id)
-    return apply_pagination(query, pagination).all()
+    return apply_pagination(query, pagination, key=QcRead.id).all()
 
 
 @router.get("/{qc_read_id}", response_model=QcReadOut)
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.read import Read
 from app.models.user import User
@@ -30,7 +30,7 @@ _READ_MUTABLE_FIELDS = {
 @router.get("/", response_model=List[ReadSchema])
 def read_reads(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     experiment_id: Optional[UUID] = Query(None, description="Filter by experiment ID"),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
@@ -41,7 +41,7 @@ def read_reads(
     if experiment_id:
         query = query.filter(Read.experiment_id == experiment_id)
 
-    reads = apply_pagination(query, pagination).all()
+    reads = apply_pagination(query, pagination, key=Read.id).all()
     return reads
 
 
@@ -1,11 +1,13 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.http_cache import compute_etag, conditional_response
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.models.project import Project
 from app.models.sample import Sample, SampleSubmission
@@ -22,6 +24,11 @@ from app.schemas.sample import (
 
 router = APIRouter()
 
+# Columns backing the submission response schema, for read-only list queries
+_SUBMISSION_SCHEMA_COLUMNS = tuple(
+    getattr(SampleSubmission, field) for field in SampleSubmissionSchema.model_fields
+)
+
 
 def _resolve_sample_submission_project_id(db: Session, sample_id: UUID) -> UUID:
     sample = db.query(Sample).filter(Sample.id == sample_id).first()
@@ -44,11 +51,13 @@ def _resolve_sample_submission_project_id(db: Session, sample_id: UUID) -> UUID:
     return project.id
 
 
-@router.get("/", response_model=List[SampleSubmissionSchema])
+@router.get("/", response_model=List[SampleSubmissionSchema], response_model_exclude_none=True)
 @policy("sample_submissions:read")
-def read_sample_submissions(
+def list_sample_submissions(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     status: Optional[SchemaSubmissionStatus] = Query(
         None, description="Filter by submission status"
     ),
@@ -59,23 +68,27 @@ def read_sample_submissions(
     """
     Retrieve sample submissions.
     """
-    query = db.query(SampleSubmission)
+    # Select plain columns so rows skip ORM hydration and the identity map.
+    query = select(*_SUBMISSION_SCHEMA_COLUMNS)
     if status:
-        query = query.filter(SampleSubmission.status == status)
+        query = query.where(SampleSubmission.status == status)
 
-    submissions = apply_pagination(query, pagination).all()
-    return submissions
+    rows = db.execute(apply_pagination(query, pagination, key=SampleSubmission.id)).all()
+    not_modified = conditional_response(request, response, compute_etag(rows))
+    if not_modified:
+        return not_modified
+    return [SampleSubmissionSchema.model_validate(row) for row in rows]
 
 
 @router.get("/{submission_id}", response_model=SampleSubmissionSchema)
 @policy("sample_submissions:read")
-def read_sample_submission(
+def get_sample_submission(
     submission_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
-    Retrieve sample submissions.
+    Retrieve a sample submission by ID.
     """
     submission = db.query(SampleSubmission).filter(SampleSubmission.id == submission_id).first()
     if not submission:
@@ -108,7 +121,6 @@ def create_sample_submission(
     )
     db.add(submission)
     db.commit()
-    db.refresh(submission)
     return submission
 
 
@@ -1,17 +1,30 @@
 import json
+import logging
 import os
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session, load_only, selectinload
 
 from app.core.dependencies import get_current_active_user, get_db
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.http_cache import compute_etag, conditional_response
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
+from app.db.loading import list_load_options
 from app.models.experiment import Experiment
 from app.models.organism import Organism
 from app.models.project import Project
@@ -32,6 +45,8 @@ from app.schemas.sample import (
 from app.schemas.sample import SampleSubmission as SampleSubmissionSchema
 from app.utils.mapping import to_float
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 _SAMPLE_MAPPING_PATH = os.path.join(
@@ -80,12 +95,26 @@ _SAMPLE_MUTABLE_FIELDS = (
     | _SAMPLE_NUMERIC_FIELDS
     | {"taxon_id", "derived_from_sample_id", "kind", "extensions"}
 )
+# Columns backing the sample response schema, for read-only list queries
+_SAMPLE_SCHEMA_COLUMNS = tuple(getattr(Sample, field) for field in SampleSchema.model_fields)
 
 
 def _organism_taxon_id(organism: Any) -> int:
     return organism.taxon_id if hasattr(organism, "taxon_id") else organism.tax_id
 
 
+def _coerce_taxon_id(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_sample(db: Session, sample_id: UUID) -> Optional[Sample]:
+    """Fetch a sample by primary key with a cacheable select() statement."""
+    return db.execute(select(Sample).where(Sample.id == sample_id)).scalar_one_or_none()
+
+
 def _get_genomic_data_project_id(db: Session, taxon_id: int) -> UUID:
     """Get the genomic_data project ID for an organism."""
     project = (
@@ -105,13 +134,21 @@ def _load_sample_mapping() -> Dict[str, Any]:
         return json.load(f)
 
 
+# The mapping file ships with the code, so it is read once at import and kept
+# as (ena_key, atol_key) pairs for the payload comprehension below
+_SAMPLE_MAP = tuple(_load_sample_mapping()["sample"].items())
+_SAMPLE_MAPPED_KEYS = frozenset(atol_key for _, atol_key in _SAMPLE_MAP)
+
+
 def _build_sample_prepared_payload(sample_data: Dict[str, Any]) -> Dict[str, Any]:
-    ena_atol_map = _load_sample_mapping()
-    prepared_payload = {}
-    for ena_key, atol_key in ena_atol_map["sample"].items():
-        if atol_key in sample_data:
-            prepared_payload[ena_key] = sample_data[atol_key]
-    return prepared_payload
+    # Updates that touch no mapped field (e.g. only `title`) need no mapping pass
+    if _SAMPLE_MAPPED_KEYS.isdisjoint(sample_data):
+        return {}
+    return {
+        ena_key: sample_data[atol_key]
+        for ena_key, atol_key in _SAMPLE_MAP
+        if atol_key in sample_data
+    }
 
 
 def _validate_sample_lineage(
@@ -142,6 +179,7 @@ def _validate_sample_lineage(
     if kind == SampleKind.SPECIMEN and specimen_id:
         existing_specimen = (
             db.query(Sample)
+            .options(load_only(Sample.id))
             .filter(
                 Sample.taxon_id == taxon_id,
                 Sample.specimen_id == specimen_id,
@@ -157,7 +195,7 @@ def _validate_sample_lineage(
             )
 
     if derived_from_sample_id:
-        parent_sample = db.query(Sample).filter(Sample.id == derived_from_sample_id).first()
+        parent_sample = _get_sample(db, derived_from_sample_id)
         if not parent_sample:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -178,20 +216,20 @@ def _validate_sample_lineage(
 @router.get("/", response_model=List[SampleSchema])
 def read_samples(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     taxon_id: Optional[int] = Query(None, description="Filter by organism taxon ID"),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve samples.
     """
-    # All users can read samples
-    query = db.query(Sample)
+    # All users can read samples. Select plain columns so rows skip ORM hydration.
+    query = select(*_SAMPLE_SCHEMA_COLUMNS)
     if taxon_id:
-        query = query.filter(Sample.taxon_id == taxon_id)
+        query = query.where(Sample.taxon_id == taxon_id)
 
-    samples = apply_pagination(query, pagination).all()
-    return samples
+    rows = db.execute(apply_pagination(query, pagination, key=Sample.id)).mappings().all()
+    return [SampleSchema.model_validate(row) for row in rows]
 
 
 @router.get(
@@ -206,7 +244,12 @@ def get_samples_experiments_and_reads_for_specimen(
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Return the specimen sample, related samples, and nested experiments/reads."""
-    organism = db.query(Organism).filter(Organism.taxon_id == taxon_id).first()
+    organism = (
+        db.query(Organism)
+        .options(load_only(Organism.taxon_id))
+        .filter(Organism.taxon_id == taxon_id)
+        .first()
+    )
     if not organism:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -230,6 +273,7 @@ def get_samples_experiments_and_reads_for_specimen(
 
     related_samples = (
         db.query(Sample)
+        .options(*list_load_options())
         .filter(
             Sample.taxon_id == organism.taxon_id,
             or_(
@@ -239,18 +283,55 @@ def get_samples_experiments_and_reads_for_specimen(
         .all()
     )
 
-    related_payload = []
-    for sample in related_samples:
-        experiments = db.query(Experiment).filter(Experiment.sample_id == sample.id).all()
-        experiment_payload = []
-        for experiment in experiments:
-            reads = db.query(Read).filter(Read.experiment_id == experiment.id).all()
-            qc_reads = db.query(QcRead).filter(QcRead.experiment_id == experiment.id).all()
-            experiment_payload.append(
-                {"experiment": experiment, "reads": reads, "qc_reads": qc_reads}
+    # Load experiments, reads and QC reads for every related sample in one IN query
+    # per table instead of one query per sample/experiment.
+    experiments = (
+        db.query(Experiment)
+        .options(*list_load_options())
+        .filter(Experiment.sample_id.in_([sample.id for sample in related_samples]))
+        .all()
+        if related_samples
+        else []
+    )
+    experiment_ids = [experiment.id for experiment in experiments]
+    reads_by_experiment = defaultdict(list)
+    qc_reads_by_experiment = defaultdict(list)
+    if experiment_ids:
+        reads = (
+            db.query(Read)
+            .options(*list_load_options())
+            .filter(Read.experiment_id.in_(experiment_ids))
+            .all()
+        )
+        for read in reads:
+            reads_by_experiment[read.experiment_id].append(read)
+        qc_reads = (
+            db.query(QcRead)
+            .options(
+                *list_load_options(
+                    selectinload(QcRead.files), selectinload(QcRead.submission_records)
+                )
             )
+            .filter(QcRead.experiment_id.in_(experiment_ids))
+            .all()
+        )
+        for qc_read in qc_reads:
+            qc_reads_by_experiment[qc_read.experiment_id].append(qc_read)
+
+    experiments_by_sample = defaultdict(list)
+    for experiment in experiments:
+        experiments_by_sample[experiment.sample_id].append(
+            {
+                "experiment": experiment,
+                "reads": reads_by_experiment[experiment.id],
+                "qc_reads": qc_reads_by_experiment[experiment.id],
+            }
+        )
 
-        related_payload.append({"sample": sample, "experiments": experiment_payload})
+    related_payload = [
+        {"sample": sample, "experiments": experiments_by_sample[sample.id]}
+        for sample in related_samples
+    ]
 
     return {
         "taxon_id": organism.taxon_id,
@@ -273,7 +354,12 @@ def get_specimen_by_taxid_and_specimen_id(
     This finds the unique specimen sample for a given organism (by taxon_id)
     and specimen_id combination.
     """
-    organism = db.query(Organism).filter(Organism.taxon_id == taxon_id).first()
+    organism = (
+        db.query(Organism)
+        .options(load_only(Organism.taxon_id))
+        .filter(Organism.taxon_id == taxon_id)
+        .first()
+    )
     if not organism:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -387,8 +473,6 @@ def create_sample(
     )
     db.add(sample_submission)
     db.commit()
-    db.refresh(sample)
-    db.refresh(sample_submission)
     return sample
 
 
@@ -400,7 +484,6 @@ def _create_sample_with_submission(
     taxon_id: int,
     kind: SampleKind,
     derived_from_sample_id: Optional[UUID] = None,
-    ena_atol_map: Optional[Dict] = None,
 ) -> tuple[Sample, SampleSubmission]:
     """
     Helper function to create a sample and its submission record.
@@ -489,13 +572,7 @@ def _create_sample_with_submission(
 
     sample = Sample(**sample_kwargs)
 
-    # Create prepared_payload based on the mapping
-    prepared_payload = {}
-    if ena_atol_map:
-        sample_mapping = ena_atol_map.get("sample", {})
-        for ena_key, atol_key in sample_mapping.items():
-            if atol_key in sample_data:
-                prepared_payload[ena_key] = sample_data[atol_key]
+    prepared_payload = _build_sample_prepared_payload(sample_data)
 
     # Get project_id for this organism
     project_id = _get_genomic_data_project_id(db, taxon_id)
@@ -528,15 +605,6 @@ def bulk_import_specimen_samples(
     Each sample must have taxon_id and specimen_id.
     Enforces uniqueness constraint: one specimen per (taxon_id, specimen_id).
     """
-    # Load the ENA-ATOL mapping file
-    ena_atol_map_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        "config",
-        "ena-atol-map.json",
-    )
-    with open(ena_atol_map_path, "r") as f:
-        ena_atol_map = json.load(f)
-
     created_count = 0
     skipped_count = 0
     errors = []
@@ -550,7 +618,12 @@ def bulk_import_specimen_samples(
                 skipped_count += 1
                 continue
 
-            organism = db.query(Organism).filter(Organism.taxon_id == int(taxon_id)).first()
+            organism = (
+                db.query(Organism)
+                .options(load_only(Organism.taxon_id))
+                .filter(Organism.taxon_id == int(taxon_id))
+                .first()
+            )
             if not organism:
                 errors.append(f"{sample_key}: Organism not found with taxon_id '{taxon_id}'")
                 skipped_count += 1
@@ -568,6 +641,7 @@ def bulk_import_specimen_samples(
             # Check for duplicate specimen
             existing_specimen = (
                 db.query(Sample)
+                .options(load_only(Sample.id))
                 .filter(
                     Sample.taxon_id == organism_taxon_id,
                     Sample.specimen_id == specimen_id,
@@ -592,7 +666,6 @@ def bulk_import_specimen_samples(
                 taxon_id=organism_taxon_id,
                 kind=SampleKind.SPECIMEN,
                 derived_from_sample_id=None,
-                ena_atol_map=ena_atol_map,
             )
 
             db.add(sample)
@@ -633,15 +706,6 @@ def bulk_import_derived_samples(
 
     The parent specimen is looked up by (taxon_id, specimen_id) or (taxon_id, specimen_id).
     """
-    # Load the ENA-ATOL mapping file
-    ena_atol_map_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        "config",
-        "ena-atol-map.json",
-    )
-    with open(ena_atol_map_path, "r") as f:
-        ena_atol_map = json.load(f)
-
     created_count = 0
     skipped_count = 0
     errors = []
@@ -656,7 +720,12 @@ def bulk_import_derived_samples(
                 continue
 
             # Check if sample already exists by bpa_sample_id
-            existing = db.query(Sample).filter(Sample.bpa_sample_id == bpa_sample_id).first()
+            existing = (
+                db.query(Sample)
+                .options(load_only(Sample.id))
+                .filter(Sample.bpa_sample_id == bpa_sample_id)
+                .first()
+            )
             if existing:
                 skipped_count += 1
                 continue
@@ -664,7 +733,12 @@ def bulk_import_derived_samples(
             taxon_id = sample_data.get("taxon_id")
             organism = None
             if taxon_id is not None:
-                organism = db.query(Organism).filter(Organism.taxon_id == int(taxon_id)).first()
+                organism = (
+                    db.query(Organism)
+                    .options(load_only(Organism.taxon_id))
+                    .filter(Organism.taxon_id == int(taxon_id))
+                    .first()
+                )
 
             if not organism:
                 errors.append(f"{sample_key}: Organism not found (provide taxon_id)")
@@ -683,6 +757,7 @@ def bulk_import_derived_samples(
             # Lookup parent specimen by (taxon_id, specimen_id)
             parent_specimen = (
                 db.query(Sample)
+                .options(load_only(Sample.id))
                 .filter(
                     Sample.taxon_id == organism_taxon_id,
                     Sample.specimen_id == specimen_id,
@@ -707,7 +782,6 @@ def bulk_import_derived_samples(
                 taxon_id=organism_taxon_id,
                 kind=SampleKind.DERIVED,
                 derived_from_sample_id=parent_specimen.id,
-                ena_atol_map=ena_atol_map,
             )
 
             db.add(sample)
@@ -736,20 +810,32 @@ def get_sample_prepared_payload(
     *,
     db: Session = Depends(get_db),
     sample_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get prepared_payload for a specific sample.
     """
+    # Select only the payload and the ETag inputs as a plain row; the other columns
+    # (notably response_payload) are never fetched or hydrated into an ORM object
     sample_submission = (
-        db.query(SampleSubmission).filter(SampleSubmission.sample_id == sample_id).first()
+        db.query(
+            SampleSubmission.id, SampleSubmission.prepared_payload, SampleSubmission.updated_at
+        )
+        .filter(SampleSubmission.sample_id == sample_id)
+        .order_by(SampleSubmission.updated_at.desc())
+        .first()
     )
     if not sample_submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Sample submission data not found",
         )
-    return {"prepared_payload": getattr(sample_submission, "prepared_payload")}
+    not_modified = conditional_response(request, response, compute_etag([sample_submission]))
+    if not_modified:
+        return not_modified
+    return {"prepared_payload": sample_submission.prepared_payload}
 
 
 @router.get("/{sample_id}", response_model=SampleSchema)
@@ -757,15 +843,20 @@ def read_sample(
     *,
     db: Session = Depends(get_db),
     sample_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get sample by ID.
     """
     # All users can read sample details
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = _get_sample(db, sample_id)
     if not sample:
         raise HTTPException(status_code=404, detail="Sample not found")
+    not_modified = conditional_response(request, response, compute_etag([sample]))
+    if not_modified:
+        return not_modified
     return sample
 
 
@@ -782,7 +873,7 @@ def update_sample(
     Update a sample.
     """
     try:
-        sample = db.query(Sample).filter(Sample.id == sample_id).first()
+        sample = _get_sample(db, sample_id)
         if not sample:
             raise HTTPException(status_code=404, detail="Sample not found")
 
@@ -837,30 +928,39 @@ def update_sample(
 
             elif latest_sample_submission.status == "accepted":
                 # change old record's status to "replaced" and create a new record
-                # retain accessions
-                setattr(latest_sample_submission, "status", "replaced")
-                db.add(latest_sample_submission)
+                # retain accessions; neither row is needed as an ORM instance afterwards
                 project_id = _get_genomic_data_project_id(db, sample.taxon_id)
-                new_sample_submission = SampleSubmission(
-                    sample_id=sample_id,
-                    authority=sample_submission.authority,
-                    entity_type_const="sample",
-                    prepared_payload=prepared_payload,
-                    response_payload=None,
-                    accession=sample_submission.accession,
-                    biosample_accession=sample_submission.biosample_accession,
-                    status="draft",
-                    project_id=project_id,
+                db.execute(
+                    update(SampleSubmission)
+                    .where(SampleSubmission.id == latest_sample_submission.id)
+                    .values(status="replaced")
+                )
+                db.execute(
+                    insert(SampleSubmission).values(
+                        sample_id=sample_id,
+                        authority=sample_submission.authority,
+                        entity_type_const="sample",
+                        prepared_payload=prepared_payload,
+                        response_payload=None,
+                        accession=sample_submission.accession,
+                        biosample_accession=sample_submission.biosample_accession,
+                        status="draft",
+                        project_id=project_id,
+                    )
                 )
-                db.add(new_sample_submission)
             elif (
                 latest_sample_submission.status == "draft"
                 or latest_sample_submission.status == "ready"
             ):
                 # update the existing record, since it has not yet been submitted to ENA (set status = 'draft')
-                setattr(latest_sample_submission, "prepared_payload", prepared_payload)
-                setattr(latest_sample_submission, "status", "draft")
-                db.add(latest_sample_submission)
+                # an unchanged draft needs no write at all
+                if not (
+                    latest_sample_submission.status == "draft"
+                    and latest_sample_submission.prepared_payload == prepared_payload
+                ):
+                    setattr(latest_sample_submission, "prepared_payload", prepared_payload)
+                    setattr(latest_sample_submission, "status", "draft")
+                    db.add(latest_sample_submission)
 
         target_kind = SampleKind(sample_data["kind"]) if "kind" in sample_data else sample.kind
         target_taxon_id = sample_data.get("taxon_id", sample.taxon_id)
@@ -893,9 +993,8 @@ def update_sample(
     except HTTPException:
         db.rollback()
         raise
-    except Exception as e:
-        print(f"Error updating sample with sample_id: {sample_id}")
-        print(e)
+    except Exception:
+        logger.exception("Error updating sample with sample_id=%s", sample_id)
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to update sample")
 
@@ -911,7 +1010,7 @@ def delete_sample(
     """
     Delete a sample.
     """
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = _get_sample(db, sample_id)
     if not sample:
         raise HTTPException(status_code=404, detail="Sample not found")
 
@@ -923,6 +1022,35 @@ def delete_sample(
 # Sample Fetched endpoints have been removed as they are no longer in the schema
 
 
+def _insert_sample_rows_individually(
+    db: Session,
+    sample_rows: List[Dict[str, Any]],
+    submission_rows: List[Dict[str, Any]],
+    errors: List[str],
+) -> int:
+    """
+    Insert each sample and its submission in its own savepoint.
+
+    Used when the batch INSERT is rejected, so one bad row only loses itself.
+    Failures are appended to ``errors``; returns the number of rows inserted.
+    """
+    created = 0
+    for sample_row, submission_row in zip(sample_rows, submission_rows):
+        bpa_sample_id = sample_row["bpa_sample_id"]
+        try:
+            with db.begin_nested():
+                db.execute(insert(Sample), [sample_row])
+                db.execute(insert(SampleSubmission), [submission_row])
+        except (IntegrityError, DataError) as e:
+            logger.warning(
+                "Error inserting sample with bpa_sample_id=%s: %s", bpa_sample_id, e.orig
+            )
+            errors.append(f"{bpa_sample_id}: {str(e.orig).strip()}")
+            continue
+        created += 1
+    return created
+
+
 @router.post("/bulk-import", response_model=BulkImportResponse)
 @policy("samples:bulk_import")
 def bulk_import_samples(
@@ -939,44 +1067,61 @@ def bulk_import_samples(
     The request body should directly match the format of the JSON file in data/unique_samples.json,
     which is a dictionary keyed by bpa_sample_id without a wrapping 'samples' key.
     """
-    # Load the ENA-ATOL mapping file
-    ena_atol_map_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        "config",
-        "ena-atol-map.json",
-    )
-    with open(ena_atol_map_path, "r") as f:
-        ena_atol_map = json.load(f)
-
-    # Get the sample mapping section
-    sample_mapping = ena_atol_map.get("sample", {})
-
-    created_samples_count = 0
-    created_submission_count = 0
     skipped_count = 0
+    errors: List[str] = []
+    # Rows are collected here and written with one INSERT per table and one commit
+    sample_rows: List[Dict[str, Any]] = []
+    submission_rows: List[Dict[str, Any]] = []
+    batch_specimen_keys = set()
+    project_ids: Dict[int, UUID] = {}
+
+    # Resolve existing samples and known organisms up front with one IN query each
+    existing_bpa_sample_ids = set()
+    if samples_data:
+        existing_bpa_sample_ids = {
+            row.bpa_sample_id
+            for row in db.query(Sample.bpa_sample_id)
+            .filter(Sample.bpa_sample_id.in_(list(samples_data)))
+            .all()
+        }
+    requested_taxon_ids = {
+        _coerce_taxon_id(sample_data["taxon_id"])
+        for sample_data in samples_data.values()
+        if "taxon_id" in sample_data
+    }
+    requested_taxon_ids.discard(None)
+    known_taxon_ids = set()
+    if requested_taxon_ids:
+        known_taxon_ids = {
+            row.taxon_id
+            for row in db.query(Organism.taxon_id)
+            .filter(Organism.taxon_id.in_(requested_taxon_ids))
+            .all()
+        }
+
+    # Partition out samples that already exist or have no known organism, so the
+    # loop below only sees importable rows and skips are logged once
+    importable = {
+        bpa_sample_id: sample_data
+        for bpa_sample_id, sample_data in samples_data.items()
+        if bpa_sample_id not in existing_bpa_sample_ids
+        and _coerce_taxon_id(sample_data.get("taxon_id")) in known_taxon_ids
+    }
+    skipped_count += len(samples_data) - len(importable)
+    without_organism = [
+        bpa_sample_id
+        for bpa_sample_id in samples_data
+        if bpa_sample_id not in importable and bpa_sample_id not in existing_bpa_sample_ids
+    ]
+    if without_organism:
+        logger.warning(
+            "Organism not found for %d samples, skipping: %s",
+            len(without_organism),
+            ", ".join(without_organism),
+        )
 
-    for bpa_sample_id, sample_data in samples_data.items():
-        # Check if sample already exists
-        existing = db.query(Sample).filter(Sample.bpa_sample_id == bpa_sample_id).first()
-        if existing:
-            skipped_count += 1
-            continue
-
-        # Get organism reference from sample data
-        taxon_id = None
-        if "taxon_id" in sample_data:
-            organism = (
-                db.query(Organism).filter(Organism.taxon_id == sample_data["taxon_id"]).first()
-            )
-        else:
-            print(f"Organism not found for sample {bpa_sample_id}, Skipping")
-            skipped_count += 1
-            continue
-        if not organism:
-            print(f"Organism not found with taxon_id {sample_data['taxon_id']}, Skipping")
-            skipped_count += 1
-            continue
-        taxon_id = organism.taxon_id
+    for bpa_sample_id, sample_data in importable.items():
+        taxon_id = _coerce_taxon_id(sample_data["taxon_id"])
         try:
             # Create new sample
             sample_id = uuid.uuid4()
@@ -999,22 +1144,26 @@ def bulk_import_samples(
             # Check for duplicate specimen: one specimen per (taxon_id, specimen_id)
             specimen_id_val = sample_data.get("specimen_id")
             if kind == SampleKind.SPECIMEN and specimen_id_val:
-                existing_specimen = (
-                    db.query(Sample)
+                specimen_key = (taxon_id, specimen_id_val)
+                existing_specimen = specimen_key in batch_specimen_keys or (
+                    db.query(Sample.id)
                     .filter(
                         Sample.taxon_id == taxon_id,
                         Sample.specimen_id == specimen_id_val,
                         Sample.kind == SampleKind.SPECIMEN,
                     )
                     .first()
+                    is not None
                 )
                 if existing_specimen:
-                    print(
-                        f"Specimen sample already exists for taxon_id '{taxon_id}' "
-                        f"and specimen_id '{specimen_id_val}', skipping"
+                    logger.warning(
+                        "Specimen sample already exists for taxon_id=%s specimen_id=%s, skipping",
+                        taxon_id,
+                        specimen_id_val,
                     )
                     skipped_count += 1
                     continue
+                batch_specimen_keys.add(specimen_key)
 
             sample_kwargs = dict(
                 id=sample_id,
@@ -1053,51 +1202,70 @@ def bulk_import_samples(
                     "collector_institute"
                 ) or sample_data.get("collecting_institution")
 
-            sample = Sample(**sample_kwargs)
-            db.add(sample)
-
             # Create prepared_payload based on the mapping
-            prepared_payload = {}
-            for ena_key, atol_key in sample_mapping.items():
-                if atol_key in sample_data:
-                    prepared_payload[ena_key] = sample_data[atol_key]
+            prepared_payload = _build_sample_prepared_payload(sample_data)
 
-            # Get project_id for this organism
-            project_id = _get_genomic_data_project_id(db, taxon_id)
+            # Get project_id for this organism (looked up once per taxon)
+            if taxon_id not in project_ids:
+                project_ids[taxon_id] = _get_genomic_data_project_id(db, taxon_id)
 
-            # Create sample_submission record
-            sample_submission = SampleSubmission(
-                id=uuid.uuid4(),
-                sample_id=sample_id,
-                authority="ENA",
-                entity_type_const="sample",
-                prepared_payload=prepared_payload,
-                project_id=project_id,
+            sample_rows.append(sample_kwargs)
+            submission_rows.append(
+                dict(
+                    id=uuid.uuid4(),
+                    sample_id=sample_id,
+                    authority="ENA",
+                    entity_type_const="sample",
+                    prepared_payload=prepared_payload,
+                    project_id=project_ids[taxon_id],
+                )
             )
-            db.add(sample_submission)
 
-            db.commit()
-            created_samples_count += 1
-            created_submission_count += 1
+        except Exception as e:
+            logger.exception("Error creating sample with bpa_sample_id=%s", bpa_sample_id)
+            errors.append(f"{bpa_sample_id}: {str(e)}")
+            skipped_count += 1
 
+    created_samples_count = 0
+    if sample_rows:
+        try:
+            try:
+                db.execute(insert(Sample), sample_rows)
+                db.execute(insert(SampleSubmission), submission_rows)
+                created_samples_count = len(sample_rows)
+            except (IntegrityError, DataError):
+                # A single bad row (CHECK, FK or a concurrent unique insert) fails the
+                # whole statement, so retry row by row and keep the good ones
+                logger.warning(
+                    "Batch insert of %d samples failed, retrying row by row", len(sample_rows)
+                )
+                db.rollback()
+                created_samples_count = _insert_sample_rows_individually(
+                    db, sample_rows, submission_rows, errors
+                )
+            db.commit()
         except Exception as e:
-            print(f"Error creating sample with bpa_sample_id: {bpa_sample_id}")
-            print(e)
+            logger.exception("Error inserting batch of %d samples", len(sample_rows))
             db.rollback()
-            skipped_count += 1
+            errors.append(f"batch: {str(e)}")
+            created_samples_count = 0
+        skipped_count += len(sample_rows) - created_samples_count
+
+    created_submission_count = created_samples_count
 
     return {
         "created_count": created_samples_count,
         "skipped_count": skipped_count,
         "message": f"Sample import complete. Created samples: {created_samples_count}, "
         f"Created submission records: {created_submission_count}, Skipped: {skipped_count}",
+        "errors": errors if errors else None,
     }
 
 
 @router.get(
     "/submission/by-experiment/{bpa_package_id}", response_model=List[SampleSubmissionSchema]
 )
-async def get_sample_submission_by_experiment_package_id(
+def get_sample_submission_by_experiment_package_id(
     bpa_package_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -1107,25 +1275,27 @@ async def get_sample_submission_by_experiment_package_id(
 
     This endpoint retrieves all submission sample data associated with a specific experiment BPA package ID.
     """
-    # Find the experiment with the given bpa_package_id
-    experiment = db.query(Experiment).filter(Experiment.bpa_package_id == bpa_package_id).first()
-    if not experiment:
+    # Fetch the experiment's sample_id and its sample's submissions in one round trip.
+    # The outer join keeps a row (with a NULL submission) when the experiment exists
+    # but has no submissions, so each 404 case can still be told apart.
+    rows = (
+        db.query(Experiment.sample_id, SampleSubmission)
+        .outerjoin(SampleSubmission, SampleSubmission.sample_id == Experiment.sample_id)
+        .filter(Experiment.bpa_package_id == bpa_package_id)
+        .all()
+    )
+    if not rows:
         raise HTTPException(
             status_code=404, detail=f"Experiment with bpa_package_id {bpa_package_id} not found"
         )
 
-    # Get the sample_id from the experiment
-    if not experiment.sample_id:
+    if not rows[0].sample_id:
         raise HTTPException(
             status_code=404,
             detail=f"Experiment with bpa_package_id {bpa_package_id} has no associated sample",
         )
 
-    # Find the submission records for this sample
-    submission_records = (
-        db.query(SampleSubmission).filter(SampleSubmission.sample_id == experiment.sample_id).all()
-    )
-
+    submission_records = [row.SampleSubmission for row in rows if row.SampleSubmission]
     if not submission_records:
         raise HTTPException(
             status_code=404,
@@ -1140,21 +1310,22 @@ def get_sample_children(
     *,
     db: Session = Depends(get_db),
     sample_id: UUID,
+    pagination: Pagination = Depends(keyset_pagination_params),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
-    Get all derived samples (children) of a specimen sample.
+    Get derived samples (children) of a specimen sample, one page at a time.
     """
     # All users can read sample relationships
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = _get_sample(db, sample_id)
     if not sample:
         raise HTTPException(status_code=404, detail="Sample not found")
 
     if sample.kind != SampleKind.SPECIMEN:
         raise HTTPException(status_code=400, detail="Only specimen samples can have children")
 
-    children = db.query(Sample).filter(Sample.derived_from_sample_id == sample_id).all()
-    return children
+    query = db.query(Sample).filter(Sample.derived_from_sample_id == sample_id)
+    return apply_pagination(query, pagination, key=Sample.id).all()
 
 
 @router.get("/{sample_id}/parent", response_model=SampleSchema)
@@ -1168,7 +1339,7 @@ def get_sample_parent(
     Get the parent specimen sample of a derived sample.
     """
     # All users can read sample relationships
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = _get_sample(db, sample_id)
     if not sample:
         raise HTTPException(status_code=404, detail="Sample not found")
 
@@ -1178,7 +1349,7 @@ def get_sample_parent(
     if not sample.derived_from_sample_id:
         raise HTTPException(status_code=404, detail="Parent sample not found")
 
-    parent = db.query(Sample).filter(Sample.id == sample.derived_from_sample_id).first()
+    parent = _get_sample(db, sample.derived_from_sample_id)
     if not parent:
         raise HTTPException(status_code=404, detail="Parent sample not found")
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user
-from app.core.pagination import Pagination, apply_pagination, pagination_params
+from app.core.pagination import Pagination, apply_pagination, keyset_pagination_params
 from app.core.policy import policy
 from app.core.security import get_password_hash
 from app.db.session import get_db
@@ -21,7 +21,7 @@ router = APIRouter()
 @policy("users:read")
 def read_users(
     db: Session = Depends(get_db),
-    pagination: Pagination = Depends(pagination_params),
+    pagination: Pagination = Depends(keyset_pagination_params),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
@@ -36,7 +36,7 @@ def read_users(
     Returns:
         List[User]: List of users
     """
-    users = apply_pagination(db.query(User), pagination).all()
+    users = apply_pagination(db.query(User), pagination, key=User.id).all()
     return users
 
 
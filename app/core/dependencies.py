@@ -1,12 +1,12 @@
 from typing import Annotated, List, Optional
 
+import jwt
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.core.security import verify_password
+from app.core.security import decode_access_token, verify_password
 from app.core.settings import settings
 from app.db.session import get_db
 from app.models.user import User
@@ -35,11 +35,11 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = decode_access_token(token)
         token_data = TokenPayload(**payload)
         if token_data.sub is None:
             raise credentials_exception
-    except (JWTError, ValidationError):
+    except (jwt.PyJWTError, ValidationError):
         raise credentials_exception
 
     user = db.query(User).filter(User.id == token_data.sub).first()
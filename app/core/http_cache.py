@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, max-age=5, stale-while-revalidate=60"
+
+
+def compute_etag(rows: Iterable[Any]) -> str:
+    """Build a strong ETag from the (id, updated_at) of each row."""
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        updated_at = getattr(row, "updated_at", None)
+        stamp = updated_at.isoformat() if updated_at is not None else ""
+        digest.update(f"{row.id}:{stamp};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Response | None:
+    """Set caching headers and return a 304 response when the client copy is current.
+
+    Returns None when the caller should go on to build the full body.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional, TypeVar
+from uuid import UUID
 
 from fastapi import Query
+from sqlalchemy import Select
 from sqlalchemy.orm import Query as SAQuery
 
+_Q = TypeVar("_Q", SAQuery, Select)
+
 
 @dataclass(frozen=True)
 class Pagination:
     offset: int
     limit: int
+    after: Optional[UUID] = None
+    # Set for endpoints that accept an ``after`` cursor: every page is then
+    # ordered by the key, so consecutive pages line up with the cursor.
+    keyset: bool = False
 
 
 def pagination_params(
@@ -19,5 +28,35 @@ def pagination_params(
     return Pagination(offset=offset, limit=limit)
 
 
-def apply_pagination(query: SAQuery, pagination: Pagination) -> SAQuery:
-    return query.offset(pagination.offset).limit(pagination.limit)
+def keyset_pagination_params(
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=500, description="Max records to return"),
+    after: Optional[UUID] = Query(
+        None,
+        description=(
+            "Keyset cursor: return records whose id sorts after this id, ordered by id. "
+            "Pass the last id of the previous page. Takes precedence over offset."
+        ),
+    ),
+) -> Pagination:
+    """Pagination for UUID-keyed list endpoints, which also accept an ``after`` cursor."""
+    return Pagination(offset=offset, limit=limit, after=after, keyset=True)
+
+
+def apply_pagination(query: _Q, pagination: Pagination, key=None) -> _Q:
+    """Apply offset/limit pagination, or keyset pagination for keyset endpoints.
+
+    In keyset mode every page, the first included, is ordered by ``key`` so the
+    last id of one page is a valid cursor for the next; with ``after`` set the
+    page seeks straight to ``key > after`` instead of scanning ``offset`` rows.
+    ``key`` must be the UUID column the cursor refers to, and queries with their
+    own ordering should not use keyset mode.
+    """
+    if not pagination.keyset:
+        return query.offset(pagination.offset).limit(pagination.limit)
+    if key is None:
+        raise ValueError("keyset pagination requires the UUID key column")
+    query = query.order_by(key)
+    if pagination.after is None:
+        return query.offset(pagination.offset).limit(pagination.limit)
+    return query.where(key > pagination.after).limit(pagination.limit)
@@ -1,8 +1,6 @@
-from __future__ import annotations
-
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from fastapi import status
 
@@ -70,18 +68,24 @@ POLICY: Dict[str, List[str]] = {
     "taxonomy_info:bulk_ncbi_refresh": ["curator", "admin"],
 }
 
+# POLICY frozen once at import so each check is a single set operation
+ACTION_ROLES: Dict[str, FrozenSet[str]] = {
+    action: frozenset(roles) for action, roles in POLICY.items()
+}
+
 
 def check_policy(user: User, action: str) -> None:
-    roles = POLICY.get(action)
+    # Superusers pass every defined action; policy() rejects undefined ones at decoration time
+    if user.is_superuser:
+        return
+    roles = ACTION_ROLES.get(action)
     if roles is None:
         raise AppError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             code="policy_missing",
             message=f"Policy not defined for action '{action}'",
         )
-    if user.is_superuser:
-        return
-    if any(role in user.roles for role in roles):
+    if user.roles and not roles.isdisjoint(user.roles):
         return
     raise AppError(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -98,25 +102,39 @@ def _check_policy_from_kwargs(action: str, kwargs: Dict[str, Any]) -> None:
             code="policy_user_missing",
             message="current_user is required for policy checks",
         )
+    # current_user is loaded per request, so actions it has passed are memoized on it
+    granted = vars(current_user).setdefault("_policy_granted", set())
+    if action in granted:
+        return
     check_policy(current_user, action)
+    granted.add(action)
 
 
-def policy(action: str) -> Callable:
-    def decorator(func: Callable) -> Callable:
-        if iscoroutinefunction(func):
+def _async_guard(func: Callable, action: str, check: Callable = _check_policy_from_kwargs):
+    @wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        check(action, kwargs)
+        return await func(*args, **kwargs)
+
+    return async_wrapper
+
 
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                _check_policy_from_kwargs(action, kwargs)
-                return await func(*args, **kwargs)
+def _sync_guard(func: Callable, action: str, check: Callable = _check_policy_from_kwargs):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        check(action, kwargs)
+        return func(*args, **kwargs)
 
-            return async_wrapper
+    return wrapper
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            _check_policy_from_kwargs(action, kwargs)
-            return func(*args, **kwargs)
 
-        return wrapper
+def policy(action: str) -> Callable:
+    if action not in ACTION_ROLES:
+        raise ValueError(f"Policy not defined for action '{action}'")
+
+    def decorator(func: Callable) -> Callable:
+        # Sync endpoints keep a sync wrapper so FastAPI still runs them in its threadpool
+        guard = _async_guard if iscoroutinefunction(func) else _sync_guard
+        return guard(func, action)
 
     return decorator
@@ -1,19 +1,32 @@
 import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple, Union
 
 import bcrypt
-from jose import jwt
+import jwt
 
 from app.core.settings import settings
 
 # TODO must enforce same byte limitation at input validation
 BCRYPT_MAX_BYTES = 72
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
+# Verified access-token claims, keyed by a digest of the token, so bursts of
+# requests carrying the same bearer token skip signature verification
+_TOKEN_CACHE_TTL_SECONDS = 30.0
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+# Auth dependencies run in the threadpool, so the cache is shared across threads
+_token_cache_lock = threading.Lock()
 
-def _bcrypt_bytes(password: str) -> bytes:
-    return password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+
+def _bcrypt_bytes(password: Union[str, bytes]) -> bytes:
+    data = password if isinstance(password, bytes) else password.encode("utf-8")
+    return data[:BCRYPT_MAX_BYTES]
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -28,45 +41,96 @@ def create_access_token(subject: Union[str, Any], expires_delta: Optional[timede
         str: Encoded JWT token
     """
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        lifetime = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": int(time.time()) + lifetime, "sub": str(subject)}
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT access token and return its claims.
+
+    Verified claims are cached for up to 30 seconds, and never past the
+    token's own ``exp``.
+
+    Args:
+        token: Encoded JWT token
+
+    Returns:
+        Dict[str, Any]: Decoded token claims
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.monotonic()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return dict(cached[1])
+
+    payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+
+    cache_until = now + _TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        cache_until = min(cache_until, now + (exp - time.time()))
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            _evict_token_cache(now)
+        _token_cache[key] = (cache_until, payload)
+    # Callers get their own copy so one request's changes never reach another
+    return dict(payload)
+
+
+def _evict_token_cache(now: float) -> None:
+    """Drop expired entries, then the oldest ones until there is room for one more.
+
+    Must be called with ``_token_cache_lock`` held.
+    """
+    for stale_key in [k for k, (until, _) in _token_cache.items() if until <= now]:
+        del _token_cache[stale_key]
+    while len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        del _token_cache[next(iter(_token_cache))]
+
+
+def verify_password(plain_password: Union[str, bytes], hashed_password: str) -> bool:
     """
     Verify a password against a hash.
 
     Args:
-        plain_password: Plain text password
+        plain_password: Plain text password, as str or UTF-8 bytes
         hashed_password: Hashed password
 
     Returns:
         bool: True if password matches hash
     """
+    if not hashed_password or not hashed_password.startswith(_BCRYPT_PREFIXES):
+        return False
+    hashed = hashed_password.encode("utf-8")
     try:
-        return bcrypt.checkpw(_bcrypt_bytes(plain_password), hashed_password.encode("utf-8"))
-    except Exception:
+        candidate = bcrypt.hashpw(_bcrypt_bytes(plain_password), hashed)
+    except ValueError:
         return False
+    # Compare the full hashes in constant time, independent of the bcrypt build
+    return hmac.compare_digest(candidate, hashed)
 
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: Union[str, bytes]) -> str:
     """
     Hash a password.
 
     Args:
-        password: Plain text password
+        password: Plain text password, as str or UTF-8 bytes
 
     Returns:
         str: Hashed password
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST)
     hashed = bcrypt.hashpw(_bcrypt_bytes(password), salt)
     return hashed.decode("utf-8")
 
@@ -84,14 +148,32 @@ def generate_refresh_token(length: int = 32) -> str:
     return secrets.token_urlsafe(length)
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: Union[str, bytes]) -> str:
     """
     Hash a token for secure storage in the database.
 
     Args:
-        token: Plain text token
+        token: Plain text token, as str or bytes
+
+    Returns:
+        str: Hex-encoded BLAKE2b-256 digest of the token
+    """
+    data = token if isinstance(token, bytes) else token.encode()
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def legacy_hash_token(token: Union[str, bytes]) -> str:
+    """
+    Hash a token the way refresh tokens were stored before BLAKE2b.
+
+    Only used to look up refresh tokens issued before the switch; they are
+    replaced with BLAKE2b hashes when rotated.
+
+    Args:
+        token: Plain text token, as str or bytes
 
     Returns:
-        str: Hashed token
+        str: Hex-encoded SHA-256 digest of the token
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    data = token if isinstance(token, bytes) else token.encode()
+    return hashlib.sha256(data).hexdigest()
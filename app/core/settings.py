@@ -1,6 +1,9 @@
+from functools import lru_cache
 from typing import List, Optional
 
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import URL
 
 
 class Settings(BaseSettings):
@@ -27,9 +30,20 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: Optional[str] = None
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 150  # 150 minutes TODO change to 15 min for prod
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7 days
+    # log2 rounds for new password hashes; lower in dev for faster logins. bcrypt accepts 4-31.
+    BCRYPT_COST: int = Field(12, ge=4, le=31)
 
     DATABASE_URI: Optional[str] = None
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled statements kept per engine
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000  # rows per multi-row INSERT ... VALUES page
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
 
@@ -44,8 +58,8 @@ class Settings(BaseSettings):
         case_sensitive=True,
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @model_validator(mode="after")
+    def _derive_and_validate(self) -> "Settings":
         if not self.DATABASE_URI and all(
             [
                 self.POSTGRES_USER,
@@ -55,10 +69,15 @@ class Settings(BaseSettings):
                 self.POSTGRES_DB,
             ]
         ):
-            self.DATABASE_URI = (
-                f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
-                f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
-            )
+            # URL.create escapes credentials that contain URL-reserved characters
+            self.DATABASE_URI = URL.create(
+                "postgresql",
+                username=self.POSTGRES_USER,
+                password=self.POSTGRES_PASSWORD,
+                host=self.POSTGRES_SERVER,
+                port=int(self.POSTGRES_PORT),
+                database=self.POSTGRES_DB,
+            ).render_as_string(hide_password=False)
 
         # Default permissive CORS for non-prod only when unset
         if not self.BACKEND_CORS_ORIGINS and self.ENVIRONMENT != "prod":
@@ -71,6 +90,13 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URI must be set (or derived from POSTGRES_* settings)")
         if self.ENVIRONMENT == "prod" and self.BACKEND_CORS_ORIGINS == ["*"]:
             raise ValueError("BACKEND_CORS_ORIGINS cannot be ['*'] in production")
+        return self
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,25 @@
+from typing import Tuple
+
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.core.settings import settings
+
+
+def list_load_options(*options: LoaderOption) -> Tuple[LoaderOption, ...]:
+    """
+    Loader options for queries whose rows are serialized into list responses.
+
+    Outside production, ``raiseload("*")`` is appended so that any relationship
+    not eagerly loaded by ``options`` raises on access instead of silently
+    issuing one SELECT per row.
+
+    Args:
+        options: Eager-load options for the relationships the response needs
+
+    Returns:
+        Tuple of loader options to pass to ``Query.options``
+    """
+    if settings.ENVIRONMENT == "prod":
+        return options
+    return (*options, raiseload("*"))
@@ -4,10 +4,24 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.settings import settings
 
 # Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URI)
+engine = create_engine(
+    settings.DATABASE_URI,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # Bulk INSERTs are paged into multi-row VALUES; executemany UPDATE/DELETE (e.g. a
+    # flush of many modified rows) is sent through psycopg2's execute_batch
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=settings.DB_INSERTMANYVALUES_PAGE_SIZE,
+)
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class. Objects keep their loaded state after commit, so
+# create handlers can return them without a refresh SELECT; server defaults such
+# as created_at come back through INSERT ... RETURNING at flush time.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
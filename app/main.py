@@ -3,7 +3,8 @@ import logging
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy.orm import configure_mappers
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1.api import api_router
@@ -21,13 +22,15 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# Set up CORS
+# Set up CORS. Origins are passed as a frozenset so the middleware's
+# per-request "origin in allow_origins" check is a hash lookup.
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -36,10 +39,14 @@ if settings.BACKEND_CORS_ORIGINS:
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Resolve all model relationships at startup rather than on the first query,
+# so a broken mapping fails the deploy instead of a request
+configure_mappers()
+
 
 @app.exception_handler(AppError)
-def app_error_handler(_, exc: AppError):
-    return JSONResponse(
+async def app_error_handler(_, exc: AppError):
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -52,8 +59,8 @@ def app_error_handler(_, exc: AppError):
 
 
 @app.exception_handler(StarletteHTTPException)
-def http_exception_handler(_, exc: StarletteHTTPException):
-    return JSONResponse(
+async def http_exception_handler(_, exc: StarletteHTTPException):
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -66,7 +73,7 @@ def http_exception_handler(_, exc: StarletteHTTPException):
 
 
 @app.exception_handler(RequestValidationError)
-def validation_exception_handler(_, exc: RequestValidationError):
+async def validation_exception_handler(_, exc: RequestValidationError):
     errors = exc.errors()
     # Ensure errors are JSON-serializable (e.g., ValueError in ctx)
     for err in errors:
@@ -78,6 +85,8 @@ def validation_exception_handler(_, exc: RequestValidationError):
                 json.dumps(ctx["error"])
             except Exception:
                 ctx["error"] = str(ctx["error"])
+    # Stdlib json, not orjson: each error echoes the raw request input, which
+    # may hold integers wider than the 64 bits orjson can encode
     return JSONResponse(
         status_code=422,
         content={
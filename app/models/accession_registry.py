@@ -1,10 +1,10 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, Text, func
-from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import Column, DateTime, Index, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, EntityTypeEnum
 
 
 class AccessionRegistry(Base):
@@ -17,15 +17,10 @@ class AccessionRegistry(Base):
     __tablename__ = "accession_registry"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authority = Column(SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False)
+    authority = Column(AuthorityTypeEnum, nullable=False)
     accession = Column(Text, nullable=False, unique=True)
     secondary_accession = Column(Text, nullable=True)
-    entity_type = Column(
-        SQLAlchemyEnum(
-            "organism", "sample", "experiment", "read", "assembly", "project", name="entity_type"
-        ),
-        nullable=False,
-    )
+    entity_type = Column(EntityTypeEnum, nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
     accepted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -36,9 +31,20 @@ class AccessionRegistry(Base):
         onupdate=func.now(),
     )
 
-    # Table constraints
+    # Table constraints, named as Postgres names the schema's inline UNIQUEs.
+    # (authority, entity_type, entity_id) also serves lookups of an entity's accession.
     __table_args__ = (
-        # These are simplified versions of the SQL constraints:
-        # UNIQUE (authority, entity_type, entity_id)
-        # UNIQUE (authority, accession)
+        UniqueConstraint(
+            "authority",
+            "entity_type",
+            "entity_id",
+            name="accession_registry_authority_entity_type_entity_id_key",
+        ),
+        UniqueConstraint(
+            "authority", "accession", name="accession_registry_authority_accession_key"
+        ),
+        # Target of the composite accession foreign keys on sample/experiment/read
+        Index(
+            "uq_registry_full", "accession", "authority", "entity_type", "entity_id", unique=True
+        ),
     )
@@ -7,17 +7,20 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, SubmissionStatusEnum
 
 
 class Assembly(Base):
@@ -77,11 +80,28 @@ class Assembly(Base):
     manifest_json = Column(JSONB, nullable=True)
 
     # Relationships
-    organism = relationship("Organism", backref="assemblies")
-    sample = relationship("Sample", foreign_keys=[sample_id], backref="assemblies")
+    organism = relationship("Organism", back_populates="assemblies")
+    sample = relationship("Sample", foreign_keys=[sample_id], back_populates="assemblies")
     long_read_specimen_sample = relationship("Sample", foreign_keys=[long_read_specimen_sample_id])
     hic_specimen_sample = relationship("Sample", foreign_keys=[hic_specimen_sample_id])
-    project = relationship("Project", backref="assemblies")
+    project = relationship("Project", back_populates="assemblies")
+    # assembly_submission.assembly_id is ON DELETE CASCADE, so deleting an
+    # assembly leaves the rows to Postgres instead of loading them first
+    submissions = relationship(
+        "AssemblySubmission",
+        back_populates="assembly",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    runs = relationship("AssemblyRun", back_populates="assembly", cascade="all, delete-orphan")
+    files = relationship("AssemblyFile", back_populates="assembly", cascade="all, delete-orphan")
+    assembly_reads = relationship(
+        "AssemblyRead", back_populates="assembly", cascade="all, delete-orphan"
+    )
+    qc_read_links = relationship(
+        "QcReadAssembly", back_populates="assembly", cascade="all, delete-orphan"
+    )
+    genome_notes = relationship("GenomeNote", back_populates="assembly")
 
 
 class AssemblyRun(Base):
@@ -118,7 +138,10 @@ class AssemblyRun(Base):
         ),
     )
 
-    assembly = relationship("Assembly", backref=backref("runs", cascade="all, delete-orphan"))
+    assembly = relationship("Assembly", back_populates="runs")
+    stage_runs = relationship(
+        "AssemblyStageRun", back_populates="assembly_run", cascade="all, delete-orphan"
+    )
 
 
 class AssemblySubmission(Base):
@@ -135,19 +158,9 @@ class AssemblySubmission(Base):
     assembly_id = Column(
         UUID(as_uuid=True), ForeignKey("assembly.id", ondelete="CASCADE"), nullable=False
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "accepted",
-            "rejected",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
@@ -174,10 +187,19 @@ class AssemblySubmission(Base):
     )
 
     # Relationships
-    assembly = relationship(
-        "Assembly", backref=backref("submissions", cascade="all, delete-orphan")
+    assembly = relationship("Assembly", back_populates="submissions")
+    user = relationship("User", back_populates="assembly_submissions")
+
+    # At most one accepted submission per assembly and authority, enforced by Postgres
+    __table_args__ = (
+        Index(
+            "uq_assembly_one_accepted",
+            "assembly_id",
+            "authority",
+            unique=True,
+            postgresql_where=text("status = 'accepted' AND accession IS NOT NULL"),
+        ),
     )
-    user = relationship("User", backref="assembly_submissions")
 
 
 class AssemblyFile(Base):
@@ -220,7 +242,7 @@ class AssemblyFile(Base):
     )
 
     # Relationships
-    assembly = relationship("Assembly", backref=backref("files", cascade="all, delete-orphan"))
+    assembly = relationship("Assembly", back_populates="files")
 
 
 class AssemblyRead(Base):
@@ -242,11 +264,10 @@ class AssemblyRead(Base):
         PrimaryKeyConstraint("assembly_id", "read_id"),
     )
 
-    # Relationships
-    assembly = relationship(
-        "Assembly", backref=backref("assembly_reads", cascade="all, delete-orphan")
-    )
-    read = relationship("Read", backref=backref("reads_assembly", cascade="all, delete-orphan"))
+    # Relationships. The association row carries no payload, so traversing it
+    # must be explicit rather than a lazy load per link row.
+    assembly = relationship("Assembly", back_populates="assembly_reads", lazy="raise")
+    read = relationship("Read", back_populates="reads_assembly", lazy="raise")
 
 
 class AssemblyStage(Base):
@@ -258,6 +279,8 @@ class AssemblyStage(Base):
     category = Column(Text, nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
 
+    runs = relationship("AssemblyStageRun", back_populates="stage")
+
 
 class AssemblyStageRun(Base):
     """A single reported run of an assembly stage (pipeline or manual)."""
@@ -285,10 +308,11 @@ class AssemblyStageRun(Base):
         UniqueConstraint("assembly_run_id", "stage_name", name="uq_stage_run_assembly_run_stage"),
     )
 
-    assembly_run = relationship(
-        "AssemblyRun", backref=backref("stage_runs", cascade="all, delete-orphan")
+    assembly_run = relationship("AssemblyRun", back_populates="stage_runs")
+    stage = relationship("AssemblyStage", back_populates="runs")
+    files = relationship(
+        "AssemblyStageRunFile", back_populates="stage_run", cascade="all, delete-orphan"
     )
-    stage = relationship("AssemblyStage", backref="runs")
 
 
 class AssemblyStageRunFile(Base):
@@ -296,7 +320,8 @@ class AssemblyStageRunFile(Base):
 
     __tablename__ = "assembly_stage_run_file"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Generated by Postgres: rows are bulk-inserted and never referenced before INSERT
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
     assembly_stage_run_id = Column(
         UUID(as_uuid=True),
         ForeignKey("assembly_stage_run.id", ondelete="CASCADE"),
@@ -315,6 +340,4 @@ class AssemblyStageRunFile(Base):
         onupdate=func.now(),
     )
 
-    stage_run = relationship(
-        "AssemblyStageRun", backref=backref("files", cascade="all, delete-orphan")
-    )
+    stage_run = relationship("AssemblyStageRun", back_populates="files")
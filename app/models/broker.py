@@ -1,9 +1,11 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text, func, text
+from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.db.session import Base
+from app.models.enums import EntityTypeEnum
 
 
 class SubmissionAttempt(Base):
@@ -12,7 +14,7 @@ class SubmissionAttempt(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     taxon_id = Column(Integer, ForeignKey("organism.taxon_id", ondelete="RESTRICT"), nullable=True)
     campaign_label = Column(Text, nullable=True)
-    status = Column(String, nullable=False, default="processing")
+    status = Column(Text, nullable=False, default="processing")
     lock_acquired_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     lock_expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -23,17 +25,50 @@ class SubmissionAttempt(Base):
         onupdate=func.now(),
     )
 
+    __table_args__ = (
+        # Lease-expiry sweep only scans attempts that are still processing
+        Index(
+            "idx_submission_attempt_active",
+            "status",
+            "lock_expires_at",
+            postgresql_where=text("status = 'processing'"),
+        ),
+    )
+
 
 class SubmissionEvent(Base):
     __tablename__ = "submission_event"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Generated by Postgres: events are append-only and never referenced before INSERT
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
     attempt_id = Column(
         UUID(as_uuid=True), ForeignKey("submission_attempt.id", ondelete="CASCADE"), nullable=False
     )
-    entity_type = Column(String, nullable=False)  # expects values: sample|experiment|read
+    entity_type = Column(EntityTypeEnum, nullable=False)
     submission_id = Column(UUID(as_uuid=True), nullable=False)
-    action = Column(String, nullable=False)  # claimed|accepted|rejected|released|expired|progress
+    action = Column(
+        SQLAlchemyEnum(
+            "claimed",
+            "accepted",
+            "rejected",
+            "released",
+            "expired",
+            "progress",
+            name="submission_event_action",
+        ),
+        nullable=False,
+    )
     accession = Column(Text, nullable=True)
     details = Column(JSONB, nullable=True)
     at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # Per-attempt membership lookups read submission_id straight from the index
+        Index(
+            "idx_submission_event_attempt_entity",
+            "attempt_id",
+            "entity_type",
+            postgresql_include=["submission_id"],
+        ),
+        Index("idx_submission_event_entity", "entity_type", "submission_id"),
+    )
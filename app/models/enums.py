@@ -0,0 +1,29 @@
+from sqlalchemy import Enum as SQLAlchemyEnum
+
+# Postgres ENUM types shared by several tables. Each type is declared once so
+# every column binds to the same native type, with values in schema.sql order.
+
+AuthorityTypeEnum = SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type", native_enum=True)
+
+SubmissionStatusEnum = SQLAlchemyEnum(
+    "draft",
+    "ready",
+    "submitting",
+    "rejected",
+    "accepted",
+    "replaced",
+    name="submission_status",
+    native_enum=True,
+)
+
+EntityTypeEnum = SQLAlchemyEnum(
+    "organism",
+    "sample",
+    "experiment",
+    "read",
+    "assembly",
+    "project",
+    "qc_read",
+    name="entity_type",
+    native_enum=True,
+)
@@ -1,11 +1,20 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, ForeignKeyConstraint, Text, func
-from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, SubmissionStatusEnum
 
 
 class Experiment(Base):
@@ -50,7 +59,6 @@ class Experiment(Base):
     nucleic_acid_volume = Column(Text, nullable=True)
     gal = Column(Text, nullable=True)
     raw_data_release_date = Column(Text, nullable=True)
-    # bpa_json = Column(JSONB, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -60,11 +68,23 @@ class Experiment(Base):
     )
 
     # Relationships
-    sample = relationship(
-        "Sample", backref=backref("exp_sample_records", cascade="all, delete-orphan")
+    sample = relationship("Sample", back_populates="exp_sample_records")
+    project = relationship("Project", back_populates="exp_project_records")
+    reads = relationship("Read", back_populates="experiment", cascade="all, delete-orphan")
+    qc_reads = relationship("QcRead", back_populates="experiment", cascade="all, delete-orphan")
+    # experiment_submission.experiment_id is ON DELETE CASCADE, so deleting an
+    # experiment leaves the rows to Postgres instead of loading them first
+    exp_submission_records = relationship(
+        "ExperimentSubmission",
+        back_populates="experiment",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
-    project = relationship(
-        "Project", backref=backref("exp_project_records", cascade="all, delete-orphan")
+
+    # Indexes behind the sample_id / project_id filters; both already exist in schema.sql
+    __table_args__ = (
+        Index("idx_experiment_sample_id", "sample_id"),
+        Index("idx_experiment_project_id", "project_id"),
     )
 
 
@@ -81,19 +101,9 @@ class ExperimentSubmission(Base):
     experiment_id = Column(
         UUID(as_uuid=True), ForeignKey("experiment.id", ondelete="CASCADE"), nullable=True
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "accepted",
-            "rejected",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
@@ -122,9 +132,7 @@ class ExperimentSubmission(Base):
     lock_expires_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    experiment = relationship(
-        "Experiment", backref=backref("exp_submission_records", cascade="all, delete-orphan")
-    )
+    experiment = relationship("Experiment", back_populates="exp_submission_records")
 
     # Table constraints
     __table_args__ = (
@@ -141,9 +149,22 @@ class ExperimentSubmission(Base):
             deferrable=True,
             initially="DEFERRED",
         ),
-        # This is a simplified version of the SQL constraint:
-        # UNIQUE (experiment_id, authority) WHERE (status = 'accepted' AND accession IS NOT NULL)
-        # SQLAlchemy doesn't directly support WHERE clauses in constraints, so this would need custom SQL
+        # At most one accepted submission per experiment and authority, enforced by Postgres
+        Index(
+            "uq_exp_one_accepted",
+            "experiment_id",
+            "authority",
+            unique=True,
+            postgresql_where=text("status = 'accepted' AND accession IS NOT NULL"),
+        ),
+        Index("idx_experiment_submission_experiment_updated", "experiment_id", updated_at.desc()),
+        # Broker claims and lease-expiry sweeps only touch in-flight rows
+        Index(
+            "idx_experiment_submission_claimable",
+            "status",
+            "lock_expires_at",
+            postgresql_where=text("status IN ('ready', 'submitting')"),
+        ),
     )
 
 
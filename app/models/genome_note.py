@@ -1,10 +1,20 @@
-import uuid
-
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Text, UniqueConstraint, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import uuid7
 
 
 class GenomeNote(Base):
@@ -19,7 +29,7 @@ class GenomeNote(Base):
 
     __tablename__ = "genome_note"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     taxon_id = Column(Integer, ForeignKey("organism.taxon_id", ondelete="CASCADE"), nullable=False)
     assembly_id = Column(
         UUID(as_uuid=True), ForeignKey("assembly.id", ondelete="CASCADE"), nullable=False
@@ -44,13 +54,18 @@ class GenomeNote(Base):
         onupdate=func.now(),
     )
 
-    # Relationships
-    organism = relationship("Organism", backref="genome_notes")
-    assembly = relationship("Assembly", backref="genome_notes")
+    # Relationships. Never walked per row; load them explicitly when needed
+    organism = relationship("Organism", back_populates="genome_notes", lazy="raise_on_sql")
+    assembly = relationship("Assembly", back_populates="genome_notes", lazy="raise_on_sql")
 
     # Table constraints
     __table_args__ = (
         UniqueConstraint("taxon_id", "version", name="uq_genome_note_organism_version"),
-        # Note: The partial unique index for published notes is created in the schema.sql
-        # CREATE UNIQUE INDEX uq_genome_note_one_published_per_organism ON genome_note (taxon_id) WHERE is_published = TRUE;
+        # At most one published note per organism, enforced by Postgres
+        Index(
+            "uq_genome_note_one_published_per_organism",
+            "taxon_id",
+            unique=True,
+            postgresql_where=text("is_published = TRUE"),
+        ),
     )
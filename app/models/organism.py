@@ -1,6 +1,6 @@
 from sqlalchemy import Column, DateTime, Integer, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.db.session import Base
 
@@ -23,7 +23,9 @@ class Organism(Base):
     bpa_infraspecific_epithet = Column(Text, nullable=True)
     bpa_culture_or_strain_id = Column(Text, nullable=True)
     bpa_authority = Column(Text, nullable=True)
-    bpa_json = Column(JSONB, nullable=True)
+    # Raw import snapshot; only the organism responses read it, so other lookups
+    # (existence checks, name sync, claims) leave it in TOAST
+    bpa_json = deferred(Column(JSONB, nullable=True))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -38,3 +40,6 @@ class Organism(Base):
         uselist=False,
         cascade="all, delete-orphan",
     )
+    samples = relationship("Sample", back_populates="organism", cascade="all, delete-orphan")
+    assemblies = relationship("Assembly", back_populates="organism")
+    genome_notes = relationship("GenomeNote", back_populates="organism")
@@ -1,10 +1,11 @@
-import uuid
-
-from sqlalchemy import Column, DateTime, ForeignKey, Text, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Text, func, text
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, SubmissionStatusEnum
+from app.utils.uuid7 import uuid7
 
 
 class Project(Base):
@@ -16,7 +17,7 @@ class Project(Base):
 
     __tablename__ = "project"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     taxon_id = Column(
         "taxon_id", ForeignKey("organism.taxon_id", ondelete="CASCADE"), nullable=False
     )
@@ -32,21 +33,11 @@ class Project(Base):
     study_attributes = Column(JSONB, nullable=True)
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "rejected",
-            "accepted",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -55,27 +46,23 @@ class Project(Base):
         onupdate=func.now(),
     )
 
+    # Relationships
+    assemblies = relationship("Assembly", back_populates="project")
+    exp_project_records = relationship(
+        "Experiment", back_populates="project", cascade="all, delete-orphan"
+    )
+
 
 class ProjectSubmission(Base):
     __tablename__ = "project_submission"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id = Column(
         UUID(as_uuid=True), ForeignKey("project.id", ondelete="CASCADE"), nullable=False
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "rejected",
-            "accepted",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
@@ -101,19 +88,22 @@ class ProjectSubmission(Base):
     lock_acquired_at = Column(DateTime(timezone=True), nullable=True)
     lock_expires_at = Column(DateTime(timezone=True), nullable=True)
 
-
-"""
-class ProjectExperiment(Base):
-    #ProjectExperiment model for linking projects to experiments.
-
-    #This model corresponds to the 'project_experiment' table in the database.
-    __tablename__ = "project_experiment"
-
-    # Composite primary key fields
-    project_id = Column(UUID(as_uuid=True), ForeignKey("project.id"), nullable=False, primary_key=True)
-    experiment_id = Column(UUID(as_uuid=True), ForeignKey("experiment.id"), nullable=False, primary_key=True)
-
-    # Relationships
-    project = relationship("Project", backref="project_experiments")
-    experiment = relationship("Experiment", backref="project_experiments")
-"""
+    __table_args__ = (
+        # At most one accepted submission per project and authority, enforced by Postgres
+        Index(
+            "uq_project_one_accepted",
+            "project_id",
+            "authority",
+            unique=True,
+            postgresql_where=text("status = 'accepted' AND accession IS NOT NULL"),
+        ),
+        # Broker claims and lease-expiry sweeps only touch in-flight rows
+        Index(
+            "idx_project_submission_claimable",
+            "status",
+            "lock_expires_at",
+            postgresql_where=text("status IN ('ready', 'submitting')"),
+        ),
+        # Per-project lookups filter on status as well
+        Index("idx_project_submission_project_status", "project_id", "status"),
+    )
@@ -9,14 +9,16 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     ForeignKeyConstraint,
+    Index,
     Text,
     func,
+    text,
 )
-from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, SubmissionStatusEnum
 
 
 class QcRead(Base):
@@ -43,9 +45,7 @@ class QcRead(Base):
         onupdate=func.now(),
     )
 
-    experiment = relationship(
-        "Experiment", backref=backref("qc_reads", cascade="all, delete-orphan")
-    )
+    experiment = relationship("Experiment", back_populates="qc_reads")
     files = relationship("QcReadFile", back_populates="qc_read", cascade="all, delete-orphan")
     submission_records = relationship(
         "QcReadSubmission", back_populates="qc_read", cascade="all, delete-orphan"
@@ -98,19 +98,9 @@ class QcReadSubmission(Base):
     qc_read_id = Column(
         UUID(as_uuid=True), ForeignKey("qc_read.id", ondelete="CASCADE"), nullable=False
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "accepted",
-            "rejected",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
@@ -148,6 +138,21 @@ class QcReadSubmission(Base):
             deferrable=True,
             initially="DEFERRED",
         ),
+        # At most one accepted submission per QC read and authority, enforced by Postgres
+        Index(
+            "uq_qc_read_one_accepted",
+            "qc_read_id",
+            "authority",
+            unique=True,
+            postgresql_where=text("status = 'accepted' AND accession IS NOT NULL"),
+        ),
+        # Broker claims and lease-expiry sweeps only touch in-flight rows
+        Index(
+            "idx_qc_read_submission_claimable",
+            "status",
+            "lock_expires_at",
+            postgresql_where=text("status IN ('ready', 'submitting')"),
+        ),
     )
 
 
@@ -163,7 +168,5 @@ class QcReadAssembly(Base):
         UUID(as_uuid=True), ForeignKey("qc_read.id", ondelete="CASCADE"), primary_key=True
     )
 
-    assembly = relationship(
-        "Assembly", backref=backref("qc_read_links", cascade="all, delete-orphan")
-    )
+    assembly = relationship("Assembly", back_populates="qc_read_links")
     qc_read = relationship("QcRead", back_populates="assembly_links")
@@ -1,5 +1,3 @@
-import uuid
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -7,9 +5,10 @@ from sqlalchemy import (
     ForeignKey,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
 
@@ -23,7 +22,8 @@ class Read(Base):
 
     __tablename__ = "read"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Generated by Postgres: bulk-imported reads are never referenced before INSERT
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
     experiment_id = Column(
         UUID(as_uuid=True), ForeignKey("experiment.id", ondelete="CASCADE"), nullable=True
     )
@@ -36,7 +36,6 @@ class Read(Base):
     bioplatforms_url = Column(Text, nullable=True)
     read_number = Column(Text, nullable=True)
     lane_number = Column(Text, nullable=True)
-    # bpa_json = Column(JSONB, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -46,4 +45,8 @@ class Read(Base):
     )
 
     # Relationships
-    experiment = relationship("Experiment", backref=backref("reads", cascade="all, delete-orphan"))
+    # Many-to-one hops are never walked per row; load them explicitly when needed
+    experiment = relationship("Experiment", back_populates="reads", lazy="raise_on_sql")
+    reads_assembly = relationship(
+        "AssemblyRead", back_populates="read", cascade="all, delete-orphan"
+    )
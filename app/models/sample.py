@@ -7,15 +7,17 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     ForeignKeyConstraint,
+    Index,
     Text,
     func,
     text,
 )
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
+from app.models.enums import AuthorityTypeEnum, SubmissionStatusEnum
 
 
 class Sample(Base):
@@ -74,7 +76,6 @@ class Sample(Base):
     kind = Column(SQLAlchemyEnum("specimen", "derived", name="sample_kind"), nullable=False)
     extensions = Column(JSONB, nullable=True)
 
-    # bpa_json = Column(JSONB, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -84,15 +85,32 @@ class Sample(Base):
     )
 
     # Relationships
-    organism = relationship("Organism", backref=backref("samples", cascade="all, delete-orphan"))
+    organism = relationship("Organism", back_populates="samples")
+    assemblies = relationship(
+        "Assembly", foreign_keys="Assembly.sample_id", back_populates="sample"
+    )
 
     # Parent-child relationships
     parent = relationship(
         "Sample",
         remote_side=[id],
-        backref=backref("children", cascade="all, delete-orphan"),
+        back_populates="children",
+        foreign_keys=[derived_from_sample_id],
+    )
+    children = relationship(
+        "Sample",
+        back_populates="parent",
+        cascade="all, delete-orphan",
         foreign_keys=[derived_from_sample_id],
     )
+    sample_submission_records = relationship(
+        "SampleSubmission", back_populates="sample", cascade="all, delete-orphan"
+    )
+    exp_sample_records = relationship(
+        "Experiment", back_populates="sample", cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (Index("idx_sample_bpa_sample_id", "bpa_sample_id"),)
 
 
 class SampleSubmission(Base):
@@ -108,19 +126,9 @@ class SampleSubmission(Base):
     sample_id = Column(
         UUID(as_uuid=True), ForeignKey("sample.id", ondelete="CASCADE"), nullable=True
     )
-    authority = Column(
-        SQLAlchemyEnum("ENA", "NCBI", "DDBJ", name="authority_type"), nullable=False, default="ENA"
-    )
+    authority = Column(AuthorityTypeEnum, nullable=False, default="ENA")
     status = Column(
-        SQLAlchemyEnum(
-            "draft",
-            "ready",
-            "submitting",
-            "accepted",
-            "rejected",
-            "replaced",
-            name="submission_status",
-        ),
+        SubmissionStatusEnum,
         nullable=False,
         default="draft",
     )
@@ -149,9 +157,7 @@ class SampleSubmission(Base):
     lock_expires_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    sample = relationship(
-        "Sample", backref=backref("sample_submission_records", cascade="all, delete-orphan")
-    )
+    sample = relationship("Sample", back_populates="sample_submission_records")
 
     # Table constraints
     __table_args__ = (
@@ -174,9 +180,23 @@ class SampleSubmission(Base):
             deferrable=True,
             initially="DEFERRED",
         ),
-        # This is a simplified version of the SQL constraint:
-        # UNIQUE (sample_id, authority) WHERE (status = 'accepted' AND accession IS NOT NULL)
-        # SQLAlchemy doesn't directly support WHERE clauses in constraints, so this would need custom SQL
+        # Latest submission per sample (ORDER BY updated_at DESC LIMIT 1)
+        Index("idx_sample_submission_sample_updated", "sample_id", updated_at.desc()),
+        # At most one accepted submission per sample and authority, enforced by Postgres
+        Index(
+            "uq_sample_one_accepted",
+            "sample_id",
+            "authority",
+            unique=True,
+            postgresql_where=text("status = 'accepted' AND accession IS NOT NULL"),
+        ),
+        # Broker claims and lease-expiry sweeps only touch in-flight rows
+        Index(
+            "idx_sample_submission_claimable",
+            "status",
+            "lock_expires_at",
+            postgresql_where=text("status IN ('ready', 'submitting')"),
+        ),
     )
 
 
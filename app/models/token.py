@@ -30,4 +30,4 @@ class RefreshToken(Base):
     )
 
     # Relationship with User model
-    user = relationship("User", backref="refresh_tokens")
+    user = relationship("User", back_populates="refresh_tokens")
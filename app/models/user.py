@@ -3,6 +3,7 @@ from typing import List
 
 from sqlalchemy import ARRAY, Boolean, Column, DateTime, Text, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 
 from app.db.session import Base
 
@@ -31,3 +32,6 @@ class User(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+    refresh_tokens = relationship("RefreshToken", back_populates="user")
+    assembly_submissions = relationship("AssemblySubmission", back_populates="user")
@@ -1,9 +1,9 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.assembly import (
     Assembly,
@@ -23,6 +23,7 @@ from app.schemas.assembly import (
     AssemblyFileUpdate,
     AssemblyRunCreate,
     AssemblyStageRunCreate,
+    AssemblyStageRunFileCreate,
     AssemblyStageRunUpdate,
     AssemblySubmissionCreate,
     AssemblySubmissionUpdate,
@@ -32,6 +33,28 @@ from app.services.assembly_helper import determine_assembly_data_types, get_dete
 from app.services.base_service import BaseService
 
 
+def _insert_stage_run_files(
+    db: Session, stage_run_id: UUID, files: List[AssemblyStageRunFileCreate]
+) -> None:
+    """Insert a stage run's files as one executemany INSERT, bypassing ORM unit-of-work."""
+    if not files:
+        return
+    db.execute(
+        insert(AssemblyStageRunFile),
+        [
+            {
+                "assembly_stage_run_id": stage_run_id,
+                "storage_type": f.storage_type,
+                "endpoint": f.endpoint,
+                "location_root": f.location_root,
+                "location_path": f.location_path,
+                "sha256sum": f.sha256sum,
+            }
+            for f in files
+        ],
+    )
+
+
 class AssemblyService(BaseService[Assembly, AssemblyCreate, AssemblyUpdate]):
     """Service for Assembly operations."""
 
@@ -303,6 +326,7 @@ class AssemblyRunService(BaseService[AssemblyRun, AssemblyRunCreate, AssemblyRun
     def get_by_assembly_id(self, db: Session, *, assembly_id: UUID) -> List[AssemblyRun]:
         return (
             db.query(AssemblyRun)
+            .options(selectinload(AssemblyRun.stage_runs).selectinload(AssemblyStageRun.files))
             .filter(AssemblyRun.assembly_id == assembly_id)
             .order_by(AssemblyRun.created_at.desc())
             .all()
@@ -356,6 +380,7 @@ class AssemblyStageRunService(
     ) -> List[AssemblyStageRun]:
         return (
             db.query(AssemblyStageRun)
+            .options(selectinload(AssemblyStageRun.files))
             .filter(AssemblyStageRun.assembly_run_id == assembly_run_id)
             .order_by(AssemblyStageRun.created_at.desc())
             .all()
@@ -391,17 +416,7 @@ class AssemblyStageRunService(
         db.add(run)
         try:
             db.flush()
-            for f in run_in.files:
-                db.add(
-                    AssemblyStageRunFile(
-                        assembly_stage_run_id=run.id,
-                        storage_type=f.storage_type,
-                        endpoint=f.endpoint,
-                        location_root=f.location_root,
-                        location_path=f.location_path,
-                        sha256sum=f.sha256sum,
-                    )
-                )
+            _insert_stage_run_files(db, run.id, run_in.files)
             db.commit()
         except IntegrityError:
             db.rollback()
@@ -430,17 +445,7 @@ class AssemblyStageRunService(
             db.query(AssemblyStageRunFile).filter(
                 AssemblyStageRunFile.assembly_stage_run_id == db_obj.id
             ).delete()
-            for f in update_in.files:
-                db.add(
-                    AssemblyStageRunFile(
-                        assembly_stage_run_id=db_obj.id,
-                        storage_type=f.storage_type,
-                        endpoint=f.endpoint,
-                        location_root=f.location_root,
-                        location_path=f.location_path,
-                        sha256sum=f.sha256sum,
-                    )
-                )
+            _insert_stage_run_files(db, db_obj.id, update_in.files)
 
         db.commit()
         db.refresh(db_obj)
@@ -1,11 +1,13 @@
 import json
 import os
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.pagination import Pagination, apply_pagination
 from app.models.experiment import Experiment, ExperimentSubmission
 from app.models.project import Project
 from app.models.read import Read
@@ -16,6 +18,22 @@ from app.schemas.experiment import ExperimentCreate, ExperimentUpdate
 from app.services.base_service import BaseService
 from app.utils.mapping import map_to_model_columns, to_bool
 
+_EXPERIMENT_MAPPING_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "config",
+    "ena-atol-map.json",
+)
+
+
+def _load_experiment_mapping() -> Tuple[Tuple[str, str], ...]:
+    with open(_EXPERIMENT_MAPPING_PATH, "r") as f:
+        return tuple(json.load(f).get("experiment", {}).items())
+
+
+# The mapping file ships with the code, so it is read once at import and kept
+# as (ena_key, atol_key) pairs for the payload comprehensions below
+_EXPERIMENT_MAP = _load_experiment_mapping()
+
 
 class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpdate]):
     """Service for Experiment operations."""
@@ -59,21 +77,15 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
         *,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[UUID] = None,
         sample_id: Optional[UUID] = None,
     ) -> List[Experiment]:
         """List experiments with optional sample filter."""
         query = db.query(Experiment)
         if sample_id:
             query = query.filter(Experiment.sample_id == sample_id)
-        return query.offset(skip).limit(limit).all()
-
-    @staticmethod
-    def _mapping_path() -> str:
-        return os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "config",
-            "ena-atol-map.json",
-        )
+        pagination = Pagination(offset=skip, limit=limit, after=after, keyset=True)
+        return apply_pagination(query, pagination, key=Experiment.id).all()
 
     def create_experiment(self, db: Session, *, experiment_in: ExperimentCreate) -> Experiment:
         """Create experiment and corresponding submission with prepared payload."""
@@ -107,13 +119,11 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
         experiment = Experiment(**experiment_kwargs)
         db.add(experiment)
 
-        # Load mapping file and generate prepared payload
-        with open(self._mapping_path(), "r") as f:
-            ena_atol_map = json.load(f)
-        prepared_payload: Dict[str, Any] = {}
-        for ena_key, atol_key in ena_atol_map.get("experiment", {}).items():
-            if atol_key in exp_data:
-                prepared_payload[ena_key] = exp_data[atol_key]
+        prepared_payload = {
+            ena_key: exp_data[atol_key]
+            for ena_key, atol_key in _EXPERIMENT_MAP
+            if atol_key in exp_data
+        }
 
         experiment_submission = ExperimentSubmission(
             experiment_id=experiment_id,
@@ -128,14 +138,12 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
         return experiment
 
     @staticmethod
-    def _build_prepared_payload(
-        mapping: Dict[str, Any], source_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        prepared_payload: Dict[str, Any] = {}
-        for ena_key, atol_key in mapping.get("experiment", {}).items():
-            if atol_key in source_data and source_data[atol_key] is not None:
-                prepared_payload[ena_key] = source_data[atol_key]
-        return prepared_payload
+    def _build_prepared_payload(source_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            ena_key: source_data[atol_key]
+            for ena_key, atol_key in _EXPERIMENT_MAP
+            if source_data.get(atol_key) is not None
+        }
 
     def get_experiment_prepared_payload(
         self, db: Session, *, experiment_id: UUID
@@ -192,10 +200,7 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
             }
         )
 
-        # Load mapping and regenerate prepared payload
-        with open(self._mapping_path(), "r") as f:
-            ena_atol_map = json.load(f)
-        prepared_payload = self._build_prepared_payload(ena_atol_map, payload_source)
+        prepared_payload = self._build_prepared_payload(payload_source)
 
         experiment_submission = (
             db.query(ExperimentSubmission)
@@ -280,12 +285,6 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
         experiments_data: Dict[str, Dict[str, Any]],
     ) -> BulkImportResponseExperiments:
         """Bulk import experiments; create reads and submission records; return counts and debug info."""
-        # Load the ENA-ATOL mapping file
-        with open(self._mapping_path(), "r") as f:
-            ena_atol_map = json.load(f)
-
-        experiment_mapping = ena_atol_map.get("experiment", {})
-
         created_experiments_count = 0
         created_reads_count = 0
         skipped_experiments_count = 0
@@ -298,6 +297,23 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
         existing_experiment_count = 0
         missing_required_fields_count = 0
 
+        # Resolve reads that already exist with one IN query instead of one query per run
+        payload_resource_ids = {
+            run["bpa_resource_id"]
+            for experiment_data in experiments_data.values()
+            if isinstance(experiment_data.get("runs"), list)
+            for run in experiment_data["runs"]
+            if isinstance(run, dict) and run.get("bpa_resource_id")
+        }
+        existing_resource_ids = set()
+        if payload_resource_ids:
+            existing_resource_ids = {
+                resource_id
+                for (resource_id,) in db.query(Read.bpa_resource_id)
+                .filter(Read.bpa_resource_id.in_(payload_resource_ids))
+                .all()
+            }
+
         for package_id, experiment_data in experiments_data.items():
             # Check if experiment already exists
             existing_experiment = (
@@ -312,6 +328,9 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
 
                 # Process reads even though experiment exists
                 if isinstance(experiment_data.get("runs"), list):
+                    read_rows = []
+                    # Only merged into existing_resource_ids once the insert commits
+                    batch_resource_ids = set()
                     for run in experiment_data["runs"]:
                         try:
                             # Validate required fields for read
@@ -330,27 +349,25 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                                 continue
 
                             # Check if read already exists
-                            existing_read = (
-                                db.query(Read)
-                                .filter(Read.bpa_resource_id == run.get("bpa_resource_id"))
-                                .first()
-                            )
-
-                            if existing_read:
+                            if (
+                                run["bpa_resource_id"] in existing_resource_ids
+                                or run["bpa_resource_id"] in batch_resource_ids
+                            ):
                                 skipped_reads_count += 1
                                 continue
 
-                            read_id = uuid.uuid4()
+                            # Read ids come from the column's database default
                             transforms = {"optional_file": to_bool}
-                            inject = {"id": read_id, "experiment_id": experiment_id}
+                            inject = {"experiment_id": experiment_id}
                             read_kwargs = map_to_model_columns(
                                 Read,
                                 run,
                                 transforms=transforms,
                                 inject=inject,
+                                exclude={"id"},
                             )
-                            read = Read(**read_kwargs)
-                            db.add(read)
+                            read_rows.append(read_kwargs)
+                            batch_resource_ids.add(run["bpa_resource_id"])
                             created_reads_count += 1
 
                         except Exception as e:
@@ -365,9 +382,12 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                             errors.append(f"{package_id} / read '{run_identifier}': {str(e)}")
                             skipped_reads_count += 1
 
-                    # Commit reads for existing experiment
+                    # Insert reads for existing experiment in one executemany and commit
                     try:
+                        if read_rows:
+                            db.execute(insert(Read), read_rows)
                         db.commit()
+                        existing_resource_ids.update(batch_resource_ids)
                     except Exception as e:
                         errors.append(f"{package_id}: Failed to commit reads - {str(e)}")
                         db.rollback()
@@ -462,10 +482,11 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                 db.add(experiment)
 
                 # Build prepared payload for experiment submission
-                prepared_payload: Dict[str, Any] = {}
-                for ena_key, atol_key in experiment_mapping.items():
-                    if atol_key in experiment_data:
-                        prepared_payload[ena_key] = experiment_data[atol_key]
+                prepared_payload = {
+                    ena_key: experiment_data[atol_key]
+                    for ena_key, atol_key in _EXPERIMENT_MAP
+                    if atol_key in experiment_data
+                }
 
                 experiment_submission = ExperimentSubmission(
                     id=uuid.uuid4(),
@@ -477,6 +498,7 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                 db.add(experiment_submission)
 
                 # Create reads and read submissions
+                read_rows = []
                 if isinstance(experiment_data.get("runs"), list):
                     for run in experiment_data["runs"]:
                         try:
@@ -495,17 +517,17 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                                 skipped_reads_count += 1
                                 continue
 
-                            read_id = uuid.uuid4()
+                            # Read ids come from the column's database default
                             transforms = {"optional_file": to_bool}
-                            inject = {"id": read_id, "experiment_id": experiment_id}
+                            inject = {"experiment_id": experiment_id}
                             read_kwargs = map_to_model_columns(
                                 Read,
                                 run,
                                 transforms=transforms,
                                 inject=inject,
+                                exclude={"id"},
                             )
-                            read = Read(**read_kwargs)
-                            db.add(read)
+                            read_rows.append(read_kwargs)
                             created_reads_count += 1
                         except Exception as e:
                             # Try to get the most identifying information from the run
@@ -519,6 +541,11 @@ class ExperimentService(BaseService[Experiment, ExperimentCreate, ExperimentUpda
                             errors.append(f"{package_id} / read '{run_identifier}': {str(e)}")
                             skipped_reads_count += 1
 
+                # Reads reference the experiment, so it is flushed before the
+                # reads go in as one executemany INSERT bypassing the unit of work
+                if read_rows:
+                    db.flush()
+                    db.execute(insert(Read), read_rows)
                 db.commit()
                 created_experiments_count += 1
             except Exception as e:
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.pagination import Pagination, apply_pagination
 from app.models.genome_note import GenomeNote
 from app.schemas.genome_note import GenomeNoteCreate, GenomeNoteUpdate
 from app.services.base_service import BaseService
@@ -104,6 +105,7 @@ class GenomeNoteService(BaseService[GenomeNote, GenomeNoteCreate, GenomeNoteUpda
         *,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[UUID] = None,
         taxon_id: Optional[int] = None,
         assembly_id: Optional[UUID] = None,
         is_published: Optional[bool] = None,
@@ -119,7 +121,8 @@ class GenomeNoteService(BaseService[GenomeNote, GenomeNoteCreate, GenomeNoteUpda
             query = query.filter(GenomeNote.is_published == is_published)
         if title:
             query = query.filter(GenomeNote.title.ilike(f"%{title}%"))
-        return query.offset(skip).limit(limit).all()
+        pagination = Pagination(offset=skip, limit=limit, after=after, keyset=True)
+        return apply_pagination(query, pagination, key=GenomeNote.id).all()
 
 
 genome_note_service = GenomeNoteService(GenomeNote)
@@ -2,7 +2,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, selectinload, undefer
 
 from app.models.experiment import Experiment, ExperimentSubmission
 from app.models.organism import Organism
@@ -45,7 +45,12 @@ class OrganismService(BaseService[Organism, OrganismCreate, OrganismUpdate]):
 
     def get_by_taxon_id(self, db: Session, taxon_id: int) -> Optional[Organism]:
         """Get organism by taxon ID."""
-        return db.query(Organism).filter(Organism.taxon_id == taxon_id).first()
+        return (
+            db.query(Organism)
+            .options(undefer(Organism.bpa_json))
+            .filter(Organism.taxon_id == taxon_id)
+            .first()
+        )
 
     def get_multi_with_filters(
         self,
@@ -57,7 +62,7 @@ class OrganismService(BaseService[Organism, OrganismCreate, OrganismUpdate]):
         taxon_id: Optional[int] = None,
     ) -> List[Organism]:
         """Get organisms with filters."""
-        query = db.query(Organism)
+        query = db.query(Organism).options(undefer(Organism.bpa_json))
         if bpa_scientific_name:
             query = query.filter(Organism.bpa_scientific_name.ilike(f"%{bpa_scientific_name}%"))
         if taxon_id is not None:
@@ -68,7 +73,9 @@ class OrganismService(BaseService[Organism, OrganismCreate, OrganismUpdate]):
 
     def list_organisms(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Organism]:
         """List organisms with pagination."""
-        return db.query(Organism).offset(skip).limit(limit).all()
+        return (
+            db.query(Organism).options(undefer(Organism.bpa_json)).offset(skip).limit(limit).all()
+        )
 
     @staticmethod
     def _sa_obj_to_dict(obj: Any) -> Dict[str, Any]:
@@ -315,7 +322,13 @@ class OrganismService(BaseService[Organism, OrganismCreate, OrganismUpdate]):
 
     def delete_organism(self, db: Session, *, taxon_id: int) -> Optional[Organism]:
         """Delete an organism by taxon_id."""
-        organism = db.query(Organism).filter(Organism.taxon_id == taxon_id).first()
+        # Loaded up front: the deleted row is returned and serialized after commit
+        organism = (
+            db.query(Organism)
+            .options(undefer(Organism.bpa_json))
+            .filter(Organism.taxon_id == taxon_id)
+            .first()
+        )
         if not organism:
             return None
         db.delete(organism)
@@ -27,6 +27,7 @@ CREATE TYPE assembly_file_type AS ENUM (
 CREATE TYPE entity_type AS ENUM ('organism', 'sample', 'experiment', 'read', 'assembly', 'project', 'qc_read');
 CREATE TYPE project_type AS ENUM ('root', 'genomic_data', 'assembly');
 CREATE TYPE sample_kind AS ENUM ('specimen', 'derived');
+CREATE TYPE submission_event_action AS ENUM ('claimed', 'accepted', 'rejected', 'released', 'expired', 'progress');
 -- ==========================================
 -- Users and Authentication
 -- ==========================================
@@ -208,6 +209,11 @@ CREATE INDEX IF NOT EXISTS idx_project_submission_attempt ON project_submission
 CREATE INDEX IF NOT EXISTS idx_project_submission_finalised_attempt ON project_submission (finalised_attempt_id);
 CREATE INDEX IF NOT EXISTS idx_project_submission_status ON project_submission (status);
 CREATE INDEX IF NOT EXISTS idx_project_submission_lock_expires_at ON project_submission (lock_expires_at);
+CREATE INDEX IF NOT EXISTS idx_project_submission_claimable
+  ON project_submission (status, lock_expires_at)
+  WHERE status IN ('ready', 'submitting');
+CREATE INDEX IF NOT EXISTS idx_project_submission_project_status
+  ON project_submission (project_id, status);
 
 -- ==========================================
 -- Sample tables
@@ -314,8 +320,15 @@ CREATE INDEX IF NOT EXISTS idx_sample_submission_attempt ON sample_submission (a
 CREATE INDEX IF NOT EXISTS idx_sample_submission_finalised_attempt ON sample_submission (finalised_attempt_id);
 CREATE INDEX IF NOT EXISTS idx_sample_submission_status ON sample_submission (status);
 CREATE INDEX IF NOT EXISTS idx_sample_submission_lock_expires_at ON sample_submission (lock_expires_at);
+CREATE INDEX IF NOT EXISTS idx_sample_submission_claimable
+  ON sample_submission (status, lock_expires_at)
+  WHERE status IN ('ready', 'submitting');
 CREATE INDEX IF NOT EXISTS idx_sample_submission_project_id ON sample_submission (project_id);
 
+-- Latest submission per sample (ORDER BY updated_at DESC LIMIT 1)
+CREATE INDEX IF NOT EXISTS idx_sample_submission_sample_updated
+  ON sample_submission (sample_id, updated_at DESC);
+
 -- Support parent/child lookups for derived samples
 CREATE INDEX IF NOT EXISTS idx_sample_derived_from_sample_id ON sample(derived_from_sample_id);
 
@@ -329,6 +342,9 @@ CREATE UNIQUE INDEX IF NOT EXISTS uq_derived_bpa_sample_id
   ON sample (bpa_sample_id)
   WHERE kind = 'derived' AND bpa_sample_id IS NOT NULL;
 
+-- Lookup by bpa_sample_id for any sample kind (bulk import duplicate checks)
+CREATE INDEX IF NOT EXISTS idx_sample_bpa_sample_id ON sample (bpa_sample_id);
+
 -- Index for efficient lookup by taxon_id + specimen_id
 CREATE INDEX IF NOT EXISTS idx_sample_organism_specimen_lookup
   ON sample (taxon_id, specimen_id)
@@ -418,6 +434,13 @@ CREATE INDEX IF NOT EXISTS idx_experiment_submission_attempt ON experiment_submi
 CREATE INDEX IF NOT EXISTS idx_experiment_submission_finalised_attempt ON experiment_submission (finalised_attempt_id);
 CREATE INDEX IF NOT EXISTS idx_experiment_submission_status ON experiment_submission (status);
 CREATE INDEX IF NOT EXISTS idx_experiment_submission_lock_expires_at ON experiment_submission (lock_expires_at);
+CREATE INDEX IF NOT EXISTS idx_experiment_submission_claimable
+  ON experiment_submission (status, lock_expires_at)
+  WHERE status IN ('ready', 'submitting');
+
+-- Latest submission per experiment (ORDER BY updated_at DESC LIMIT 1)
+CREATE INDEX IF NOT EXISTS idx_experiment_submission_experiment_updated
+  ON experiment_submission (experiment_id, updated_at DESC);
 
 -- TODO consider if we want to keep track of former submissions that have been replaced/modified
 CREATE UNIQUE INDEX uq_exp_one_accepted
@@ -474,6 +497,9 @@ CREATE TABLE submission_attempt (
 
 CREATE INDEX IF NOT EXISTS idx_submission_attempt_status ON submission_attempt (status);
 CREATE INDEX IF NOT EXISTS idx_submission_attempt_lock_expires_at ON submission_attempt (lock_expires_at);
+CREATE INDEX IF NOT EXISTS idx_submission_attempt_active
+  ON submission_attempt (status, lock_expires_at)
+  WHERE status = 'processing';
 
 -- ==========================================
 -- Submission events (append-only audit trail)
@@ -488,13 +514,14 @@ CREATE TABLE submission_event (
     attempt_id UUID NOT NULL REFERENCES submission_attempt(id) ON DELETE CASCADE,
     entity_type entity_type NOT NULL,
     submission_id UUID NOT NULL,
-    action TEXT NOT NULL CHECK (action IN ('claimed','accepted','rejected','released','expired','progress')),
+    action submission_event_action NOT NULL,
     accession TEXT,
     details JSONB,
     at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_submission_event_attempt ON submission_event (attempt_id);
+CREATE INDEX IF NOT EXISTS idx_submission_event_attempt_entity
+  ON submission_event (attempt_id, entity_type) INCLUDE (submission_id);
 CREATE INDEX IF NOT EXISTS idx_submission_event_entity ON submission_event (entity_type, submission_id);
 
 -- ==========================================
@@ -769,6 +796,9 @@ CREATE INDEX idx_qc_read_file_qc_read_id ON qc_read_file(qc_read_id);
 CREATE INDEX idx_qc_read_submission_attempt ON qc_read_submission (attempt_id);
 CREATE INDEX idx_qc_read_submission_finalised_attempt ON qc_read_submission (finalised_attempt_id);
 CREATE INDEX idx_qc_read_submission_lock_expires_at ON qc_read_submission (lock_expires_at);
+CREATE INDEX idx_qc_read_submission_claimable
+  ON qc_read_submission (status, lock_expires_at)
+  WHERE status IN ('ready', 'submitting');
 CREATE INDEX idx_qc_read_submission_status ON qc_read_submission (status);
 CREATE INDEX idx_qc_read_assembly_qc_read_id ON qc_read_assembly (qc_read_id);
 
@@ -69,6 +69,9 @@ class FakeQuery:
     def with_for_update(self, *_, **__):
         return self
 
+    def options(self, *_):
+        return self
+
     def join(self, *_, **__):
         return self
 
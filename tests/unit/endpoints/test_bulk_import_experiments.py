@@ -19,6 +19,7 @@ class _FakeSession:
 
     def __init__(self):
         self.added = []
+        self.executed = []
         self.committed = False
         self.rolled_back = False
         self._query_results = {}
@@ -27,6 +28,12 @@ class _FakeSession:
     def add(self, obj):
         self.added.append(obj)
 
+    def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+
+    def flush(self):
+        pass
+
     def commit(self):
         self.committed = True
 
@@ -69,10 +76,13 @@ class _FakeQuery:
             return self.session._query_results.get("sample")
         elif self.model == Project:
             return self.session._query_results.get("project")
-        elif self.model == Read:
-            return self.session._query_results.get("read")
         return None
 
+    def all(self):
+        # Only the batched Read.bpa_resource_id lookup is issued as a list query
+        read = self.session._query_results.get("read")
+        return [(read.bpa_resource_id,)] if read is not None else []
+
 
 @pytest.fixture
 def mock_db():
@@ -149,6 +159,11 @@ def test_bulk_import_experiments_success(client, mock_db, mock_user):
     assert "Experiments: 1 created, 0 skipped" in data["message"]
     assert "Reads: 2 created, 0 skipped" in data["message"]
 
+    # Both reads are written by a single executemany INSERT
+    ((stmt, rows),) = mock_db.executed
+    assert stmt.table.name == "read"
+    assert [row["bpa_resource_id"] for row in rows] == ["RES001", "RES002"]
+
 
 def test_bulk_import_experiments_existing_experiment_new_reads(client, mock_db, mock_user):
     """Test bulk import when experiment exists but has new reads."""
@@ -192,6 +207,37 @@ def test_bulk_import_experiments_existing_experiment_new_reads(client, mock_db,
     assert "Reads: 2 created, 0 skipped" in data["message"]
 
 
+def test_bulk_import_experiments_failed_read_commit_does_not_mark_reads_existing(
+    client, mock_db, mock_user
+):
+    """A read whose insert failed is retried when a later experiment carries it again."""
+    mock_db._query_results["experiment"] = Experiment(
+        id=uuid.uuid4(), bpa_package_id="PKG001", sample_id=uuid.uuid4()
+    )
+    mock_db._query_results["read"] = None
+    commits = []
+
+    def _commit():
+        commits.append(True)
+        if len(commits) == 1:
+            raise RuntimeError("commit failed")
+
+    mock_db.commit = _commit
+    run = {"bpa_resource_id": "RES001", "filename": "sample_R1.fastq.gz"}
+    experiments_data = {
+        "PKG001": {"bpa_sample_id": "102.100.100/12345", "runs": [run]},
+        "PKG002": {"bpa_sample_id": "102.100.100/12345", "runs": [dict(run)]},
+    }
+
+    response = client.post("/api/v1/experiments/bulk-import", json=experiments_data)
+
+    assert response.status_code == 200
+    assert mock_db.rolled_back
+    # Both experiments attempted the insert; the second was not skipped as a duplicate
+    assert len(mock_db.executed) == 2
+    assert response.json()["skipped_reads_count"] == 0
+
+
 def test_bulk_import_experiments_existing_experiment_existing_reads(client, mock_db, mock_user):
     """Test bulk import when experiment and reads already exist."""
     # Setup existing experiment
@@ -4,15 +4,18 @@ Unit and integration tests for bulk import sample endpoints.
 Tests cover:
 - POST /samples/bulk-import-specimens
 - POST /samples/bulk-import-derived
+- POST /samples/bulk-import
 """
 
 import uuid
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.endpoints import samples
 from app.main import app
@@ -37,6 +40,9 @@ class FakeQuery:
         self._filters.append((args, kwargs))
         return self
 
+    def options(self, *args):
+        return self
+
     def first(self):
         return self._return_value
 
@@ -113,7 +119,6 @@ def test_bulk_import_specimens_success(monkeypatch):
         taxon_id,
         kind,
         derived_from_sample_id=None,
-        ena_atol_map=None,
     ):
         sample = SimpleNamespace(
             id=uuid.uuid4(),
@@ -294,7 +299,6 @@ def test_bulk_import_specimens_bpa_sample_id_optional(monkeypatch):
         taxon_id,
         kind,
         derived_from_sample_id=None,
-        ena_atol_map=None,
     ):
         # Verify bpa_sample_id can be None
         assert bpa_sample_id is None
@@ -381,7 +385,6 @@ def test_bulk_import_derived_success(monkeypatch):
         taxon_id,
         kind,
         derived_from_sample_id=None,
-        ena_atol_map=None,
     ):
         assert bpa_sample_id == "BPA123"
         assert kind == SampleKind.DERIVED
@@ -532,7 +535,6 @@ def test_bulk_import_derived_lookup_by_tax_id(monkeypatch):
         taxon_id,
         kind,
         derived_from_sample_id=None,
-        ena_atol_map=None,
     ):
         assert taxon_id == 9606
         sample = SimpleNamespace(
@@ -666,7 +668,6 @@ def test_bulk_import_specimens_multiple_samples(monkeypatch):
         taxon_id,
         kind,
         derived_from_sample_id=None,
-        ena_atol_map=None,
     ):
         sample = SimpleNamespace(
             id=uuid.uuid4(),
@@ -705,3 +706,169 @@ def test_bulk_import_specimens_multiple_samples(monkeypatch):
     body = resp.json()
     assert body["created_count"] == 3
     assert body["skipped_count"] == 0
+
+
+# ==========================================
+# Unit Tests for bulk-import
+# ==========================================
+
+
+def test_bulk_import_samples_skips_existing_and_unknown_organisms(caplog):
+    """Test bulk import resolves existing samples and organisms in batched queries."""
+    client = TestClient(app)
+
+    class CustomFakeSession(FakeSession):
+        def __init__(self):
+            super().__init__()
+            self.queried = []
+
+        def query(self, model):
+            self.queried.append(model)
+            if model is samples.Sample.bpa_sample_id:
+                return FakeQuery(return_value=[SimpleNamespace(bpa_sample_id="BPA-OLD")])
+            if model is samples.Organism.taxon_id:
+                return FakeQuery(return_value=[SimpleNamespace(taxon_id=9606)])
+            raise AssertionError(f"Unexpected per-row query: {model}")
+
+    fake_session = CustomFakeSession()
+    app.dependency_overrides[samples.get_current_active_user] = _override_user(["admin"])
+    app.dependency_overrides[samples.get_db] = _override_db(fake_session)
+
+    payload = {
+        "BPA-OLD": {"taxon_id": 9606},
+        "BPA-NO-TAXON": {},
+        "BPA-UNKNOWN": {"taxon_id": "1234"},
+    }
+    with caplog.at_level("WARNING", logger=samples.logger.name):
+        resp = client.post("/api/v1/samples/bulk-import", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created_count"] == 0
+    assert body["skipped_count"] == 3
+    assert fake_session.queried == [samples.Sample.bpa_sample_id, samples.Organism.taxon_id]
+    (record,) = caplog.records
+    assert record.getMessage().endswith("skipping: BPA-NO-TAXON, BPA-UNKNOWN")
+
+
+def test_bulk_import_samples_inserts_batch_with_single_commit():
+    """Test bulk import writes all valid rows in one batch and skips in-batch duplicates."""
+    client = TestClient(app)
+    project_id = uuid.uuid4()
+
+    class CustomFakeSession(FakeSession):
+        def __init__(self):
+            super().__init__()
+            self.executed = []
+            self.commits = 0
+
+        def query(self, model):
+            if model is samples.Sample.bpa_sample_id:
+                return FakeQuery(return_value=[])
+            if model is samples.Organism.taxon_id:
+                return FakeQuery(return_value=[SimpleNamespace(taxon_id=9606)])
+            if model is samples.Project:
+                return FakeQuery(return_value=SimpleNamespace(id=project_id))
+            if model is samples.Sample.id:
+                # Specimen duplicate check selects only the id column
+                return FakeQuery(return_value=None)
+            raise AssertionError(f"Unexpected query: {model}")
+
+        def execute(self, statement, rows):
+            self.executed.append((statement.table.name, rows))
+
+        def commit(self):
+            self.commits += 1
+
+    fake_session = CustomFakeSession()
+    app.dependency_overrides[samples.get_current_active_user] = _override_user(["admin"])
+    app.dependency_overrides[samples.get_db] = _override_db(fake_session)
+
+    payload = {
+        "BPA-1": {"taxon_id": 9606, "specimen_id": "SPEC-1", "sex": "female"},
+        "BPA-2": {"taxon_id": 9606, "specimen_id": "SPEC-2"},
+        "BPA-3": {"taxon_id": 9606, "specimen_id": "SPEC-1"},
+    }
+    resp = client.post("/api/v1/samples/bulk-import", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created_count"] == 2
+    assert body["skipped_count"] == 1
+    assert fake_session.commits == 1
+    (sample_table, sample_rows), (submission_table, submission_rows) = fake_session.executed
+    assert sample_table == "sample"
+    assert [row["bpa_sample_id"] for row in sample_rows] == ["BPA-1", "BPA-2"]
+    assert submission_table == "sample_submission"
+    assert [row["sample_id"] for row in submission_rows] == [row["id"] for row in sample_rows]
+    assert submission_rows[0]["prepared_payload"]["sex"] == "female"
+    assert {row["project_id"] for row in submission_rows} == {project_id}
+
+
+def test_bulk_import_samples_keeps_good_rows_when_one_fails_at_insert():
+    """Test a row rejected by the database is retried alone and the others still commit."""
+    client = TestClient(app)
+    project_id = uuid.uuid4()
+
+    class CustomFakeSession(FakeSession):
+        def __init__(self):
+            super().__init__()
+            self.inserted = []
+            self.savepoints = 0
+            self.commits = 0
+            self.rollbacks = 0
+
+        def query(self, model):
+            if model is samples.Sample.bpa_sample_id:
+                return FakeQuery(return_value=[])
+            if model is samples.Organism.taxon_id:
+                return FakeQuery(return_value=[SimpleNamespace(taxon_id=9606)])
+            if model is samples.Project:
+                return FakeQuery(return_value=SimpleNamespace(id=project_id))
+            if model is samples.Sample.id:
+                return FakeQuery(return_value=None)
+            raise AssertionError(f"Unexpected query: {model}")
+
+        def execute(self, statement, rows):
+            if statement.table.name == "sample" and any(
+                row["bpa_sample_id"] == "BPA-BAD" for row in rows
+            ):
+                raise IntegrityError(
+                    "INSERT INTO sample", rows, Exception("derived_from_sample_id_matches_kind")
+                )
+            self.inserted.extend((statement.table.name, row) for row in rows)
+
+        def begin_nested(self):
+            self.savepoints += 1
+            return nullcontext()
+
+        def commit(self):
+            self.commits += 1
+
+        def rollback(self):
+            self.rollbacks += 1
+
+    fake_session = CustomFakeSession()
+    app.dependency_overrides[samples.get_current_active_user] = _override_user(["admin"])
+    app.dependency_overrides[samples.get_db] = _override_db(fake_session)
+
+    payload = {
+        "BPA-1": {"taxon_id": 9606, "specimen_id": "SPEC-1"},
+        "BPA-BAD": {"taxon_id": 9606, "specimen_id": "SPEC-2"},
+        "BPA-3": {"taxon_id": 9606, "specimen_id": "SPEC-3"},
+    }
+    resp = client.post("/api/v1/samples/bulk-import", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created_count"] == 2
+    assert body["skipped_count"] == 1
+    assert body["errors"] == ["BPA-BAD: derived_from_sample_id_matches_kind"]
+    assert fake_session.rollbacks == 1
+    assert fake_session.savepoints == 3
+    assert fake_session.commits == 1
+    assert [row["bpa_sample_id"] for table, row in fake_session.inserted if table == "sample"] == [
+        "BPA-1",
+        "BPA-3",
+    ]
+    assert len([table for table, _ in fake_session.inserted if table == "sample_submission"]) == 2
@@ -12,6 +12,9 @@ class _FakeQueryList:
     def __init__(self, data):
         self.data = list(data)
 
+    def options(self, *_a):
+        return self
+
     def filter(self, *_a, **_k):
         return self
 
@@ -20,8 +23,13 @@ class _FakeQueryList:
 
 
 class _FakeSession:
+    def __init__(self, samples=()):
+        self.samples = list(samples)
+        self.queried = []
+
     def query(self, model):
-        return _FakeQueryList([])
+        self.queried.append(model)
+        return _FakeQueryList(self.samples)
 
 
 def _override_db(fake):
@@ -56,6 +64,34 @@ def test_pipeline_inputs_no_samples_returns_empty_files(monkeypatch):
     assert body[0]["files"] == {}
 
 
+def test_pipeline_inputs_walks_loaded_experiments_and_reads(monkeypatch):
+    client = TestClient(app)
+
+    organism = SimpleNamespace(scientific_name="Sci", taxon_id=1)
+    monkeypatch.setattr(
+        assemblies,
+        "organism_service",
+        SimpleNamespace(get_by_taxon_id=lambda db, taxon_id: organism),
+    )
+    reads = [
+        SimpleNamespace(file_name="a.bam", bioplatforms_url="https://example.org/a.bam"),
+        SimpleNamespace(file_name="b.bam", bioplatforms_url=None),
+    ]
+    sample = SimpleNamespace(exp_sample_records=[SimpleNamespace(reads=reads)])
+    fake_db = _FakeSession([sample])
+
+    app.dependency_overrides[assemblies.get_current_active_user] = lambda: SimpleNamespace(
+        is_active=True, roles=["admin"], is_superuser=False
+    )
+    app.dependency_overrides[assemblies.get_db] = _override_db(fake_db)
+
+    resp = client.get("/api/v1/assemblies/pipeline-inputs?taxon_id=1")
+    assert resp.status_code == 200
+    assert resp.json()[0]["files"] == {"a.bam": "https://example.org/a.bam"}
+    # Experiments and reads come from the eager-loaded samples, not per-row queries
+    assert fake_db.queried == [assemblies.Sample]
+
+
 def test_assemblies_pipeline_inputs_missing_param():
     client = TestClient(app)
     app.dependency_overrides[assemblies.get_current_active_user] = lambda: SimpleNamespace(
@@ -20,7 +20,9 @@ def test_experiments_read_empty(monkeypatch):
     monkeypatch.setattr(
         experiments,
         "experiment_service",
-        SimpleNamespace(list_experiments=lambda db, skip=0, limit=100, sample_id=None: []),
+        SimpleNamespace(
+            list_experiments=lambda db, skip=0, limit=100, after=None, sample_id=None: []
+        ),
     )
     app.dependency_overrides[experiments.get_current_active_user] = lambda: SimpleNamespace(
         is_active=True, roles=["viewer"], is_superuser=False
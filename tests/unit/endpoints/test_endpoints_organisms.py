@@ -19,6 +19,9 @@ class _FakeSession:
     def query(self, *_):
         return self
 
+    def options(self, *_):
+        return self
+
     def offset(self, *_):
         return self
 
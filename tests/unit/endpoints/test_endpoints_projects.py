@@ -13,6 +13,9 @@ class FakeQueryList:
     def __init__(self, data):
         self.data = list(data)
 
+    def order_by(self, *_):
+        return self
+
     def offset(self, *_):
         return self
 
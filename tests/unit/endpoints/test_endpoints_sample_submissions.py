@@ -54,7 +54,9 @@ class _Session:
         self.submission_obj = obj
 
     def commit(self):
-        pass
+        # Server defaults come back with INSERT ... RETURNING at flush time
+        if self.submission_obj is not None:
+            self.refresh(self.submission_obj)
 
     def refresh(self, obj):
         now = datetime.now(timezone.utc)
@@ -96,3 +98,51 @@ def test_create_sample_submission_derives_project_id():
     assert body["sample_id"] == str(sample_id)
     assert body["project_id"] == str(project_id)
     assert body["prepared_payload"] == {"title": "sample"}
+
+
+def test_list_sample_submissions_omits_none_fields():
+    client = TestClient(app)
+    now = datetime.now(timezone.utc)
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        sample_id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        authority="ENA",
+        status="draft",
+        entity_type_const="sample",
+        prepared_payload={"title": "sample"},
+        response_payload=None,
+        accession=None,
+        biosample_accession=None,
+        submitted_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    class _Result:
+        def all(self):
+            return [row]
+
+    class _RowSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, statement):
+            self.statements.append(statement)
+            return _Result()
+
+    fake_db = _RowSession()
+    app.dependency_overrides[sample_submissions.get_current_active_user] = lambda: SimpleNamespace(
+        is_active=True, roles=["curator"], is_superuser=False
+    )
+    app.dependency_overrides[sample_submissions.get_db] = _override_db(fake_db)
+
+    resp = client.get("/api/v1/sample-submissions?status=draft")
+
+    assert resp.status_code == 200
+    (statement,) = fake_db.statements
+    assert "sample_submission.status = " in str(statement)
+    (item,) = resp.json()
+    assert item["prepared_payload"] == {"title": "sample"}
+    assert "response_payload" not in item
+    assert "accession" not in item
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from urllib.parse import quote
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import samples
@@ -10,6 +11,14 @@ from app.main import app
 from app.schemas.sample import SampleCreate, SampleUpdate
 
 
+class _ScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
 class _FakeSession:
     def query(self, *_):
         return self
@@ -20,6 +29,9 @@ class _FakeSession:
     def first(self):
         return None
 
+    def execute(self, _statement):
+        return _ScalarResult(self.first())
+
 
 def _override_db(fake):
     def _gen():
@@ -39,6 +51,157 @@ def test_sample_not_found():
     assert resp.status_code == 404
 
 
+def test_read_samples_builds_schema_from_column_rows():
+    now = datetime.now(timezone.utc)
+    row = {field: None for field in samples.SampleSchema.model_fields}
+    row.update(id=uuid.uuid4(), taxon_id=1729, kind="specimen", created_at=now, updated_at=now)
+
+    class _Result:
+        def mappings(self):
+            return self
+
+        def all(self):
+            return [row]
+
+    class _Session:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, statement):
+            self.statements.append(statement)
+            return _Result()
+
+    db = _Session()
+    out = samples.read_samples(
+        db=db,
+        pagination=samples.Pagination(offset=0, limit=10),
+        taxon_id=1729,
+        current_user=SimpleNamespace(is_active=True, roles=["admin"], is_superuser=False),
+    )
+
+    assert [sample.id for sample in out] == [row["id"]]
+    assert out[0].taxon_id == 1729
+    (statement,) = db.statements
+    assert "sample.taxon_id" in str(statement)
+
+
+def test_get_sample_prepared_payload_selects_only_needed_columns():
+    submission = SimpleNamespace(
+        id=uuid.uuid4(), prepared_payload={"sex": "female"}, updated_at=datetime.now(timezone.utc)
+    )
+
+    class _Session(_FakeSession):
+        def __init__(self):
+            self.columns = ()
+
+        def query(self, *columns):
+            self.columns = columns
+            return self
+
+        def order_by(self, *_a):
+            return self
+
+        def first(self):
+            return submission
+
+    db = _Session()
+    client = TestClient(app)
+    app.dependency_overrides[samples.get_current_active_user] = lambda: SimpleNamespace(
+        is_active=True, roles=["admin"], is_superuser=False
+    )
+    app.dependency_overrides[samples.get_db] = _override_db(db)
+
+    resp = client.get(f"/api/v1/samples/{uuid.uuid4()}/prepared-payload")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"prepared_payload": {"sex": "female"}}
+    assert resp.headers["etag"] == samples.compute_etag([submission])
+    assert db.columns == (
+        samples.SampleSubmission.id,
+        samples.SampleSubmission.prepared_payload,
+        samples.SampleSubmission.updated_at,
+    )
+
+
+def test_read_sample_honours_if_none_match():
+    sample = SimpleNamespace(id=uuid.uuid4(), updated_at=datetime.now(timezone.utc))
+
+    class _Session(_FakeSession):
+        def first(self):
+            return sample
+
+    client = TestClient(app)
+    app.dependency_overrides[samples.get_current_active_user] = lambda: SimpleNamespace(
+        is_active=True, roles=["admin"], is_superuser=False
+    )
+    app.dependency_overrides[samples.get_db] = _override_db(_Session())
+
+    etag = samples.compute_etag([sample])
+    resp = client.get(f"/api/v1/samples/{sample.id}", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+
+
+def test_get_sample_uses_select_statement():
+    sample = SimpleNamespace(id=uuid.uuid4())
+
+    class _Session:
+        def execute(self, statement):
+            self.statement = statement
+            return _ScalarResult(sample)
+
+    db = _Session()
+
+    assert samples._get_sample(db, sample.id) is sample
+    assert db.statement.is_select
+    assert "WHERE sample.id = " in str(db.statement)
+
+
+def test_get_sample_children_is_paginated():
+    parent = _stored_sample(uuid.uuid4())
+    child = _stored_sample(uuid.uuid4())
+    child.kind = "derived"
+    child.derived_from_sample_id = parent.id
+
+    class _Session(_FakeSession):
+        def __init__(self):
+            self.page = {}
+
+        def first(self):
+            return parent
+
+        def order_by(self, *keys):
+            self.page["order_by"] = keys
+            return self
+
+        def offset(self, offset):
+            self.page["offset"] = offset
+            return self
+
+        def limit(self, limit):
+            self.page["limit"] = limit
+            return self
+
+        def all(self):
+            return [child]
+
+    db = _Session()
+    client = TestClient(app)
+    app.dependency_overrides[samples.get_current_active_user] = lambda: SimpleNamespace(
+        is_active=True, roles=["admin"], is_superuser=False
+    )
+    app.dependency_overrides[samples.get_db] = _override_db(db)
+
+    resp = client.get(f"/api/v1/samples/{parent.id}/children?offset=5&limit=20")
+    assert resp.status_code == 200
+    assert [item["id"] for item in resp.json()] == [str(child.id)]
+    assert db.page == {"order_by": (samples.Sample.id,), "offset": 5, "limit": 20}
+
+    resp = client.get(f"/api/v1/samples/{parent.id}/children?limit=10000")
+    assert resp.status_code == 422
+
+
 class _SampleQuery:
     def __init__(self, values):
         self.values = list(values)
@@ -47,6 +210,9 @@ class _SampleQuery:
     def filter(self, *_a, **_k):
         return self
 
+    def options(self, *_a):
+        return self
+
     def order_by(self, *_a, **_k):
         return self
 
@@ -64,6 +230,7 @@ class _SampleMutationSession:
         self.submission_query = _SampleQuery([submission])
         self.project_query = _SampleQuery([project])
         self.added = []
+        self.executed = []
         self.committed = False
 
     def query(self, model):
@@ -78,6 +245,11 @@ class _SampleMutationSession:
     def add(self, obj):
         self.added.append(obj)
 
+    def execute(self, statement):
+        if statement.is_select:
+            return _ScalarResult(self.sample_query.first())
+        self.executed.append(statement)
+
     def commit(self):
         self.committed = True
 
@@ -105,14 +277,16 @@ def test_create_sample_uses_model_fields_and_creates_submission():
     assert out.taxon_id == 1729
     assert out.specimen_id == "SPEC-1"
     assert out.lifestage == "unknown"
+    # The sample and its draft submission are written in the same commit
     submission = next(obj for obj in db.added if isinstance(obj, samples.SampleSubmission))
+    assert submission.sample_id == out.id
     assert submission.authority == "ENA"
     assert submission.project_id == project.id
+    assert db.committed
 
 
-def test_update_sample_applies_requested_field_changes():
-    sample_id = uuid.uuid4()
-    sample = SimpleNamespace(
+def _stored_sample(sample_id):
+    return SimpleNamespace(
         id=sample_id,
         taxon_id=1729,
         bpa_sample_id="BPA-1",
@@ -155,6 +329,11 @@ def test_update_sample_applies_requested_field_changes():
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
+
+
+def test_update_sample_applies_requested_field_changes():
+    sample_id = uuid.uuid4()
+    sample = _stored_sample(sample_id)
     submission = SimpleNamespace(
         id=uuid.uuid4(),
         sample_id=sample_id,
@@ -177,6 +356,88 @@ def test_update_sample_applies_requested_field_changes():
     assert out.latitude == 12.34
 
 
+def test_update_sample_skips_unchanged_draft_submission():
+    sample_id = uuid.uuid4()
+    submission = SimpleNamespace(
+        id=uuid.uuid4(),
+        sample_id=sample_id,
+        status="draft",
+        authority="ENA",
+        accession=None,
+        biosample_accession=None,
+        prepared_payload={},
+    )
+    db = _SampleMutationSession(sample=_stored_sample(sample_id), submission=submission)
+
+    samples.update_sample(
+        db=db,
+        sample_id=sample_id,
+        sample_in=SampleUpdate(state_or_region="NSW"),
+        current_user=SimpleNamespace(is_active=True, roles=["admin"], is_superuser=False),
+    )
+
+    assert submission not in db.added
+    assert submission.prepared_payload == {}
+
+
+def test_build_sample_prepared_payload_ignores_unmapped_fields():
+    assert (
+        samples._build_sample_prepared_payload({"state_or_region": "x", "kind": "specimen"}) == {}
+    )
+    assert samples._build_sample_prepared_payload({"sex": "female"}) == {"sex": "female"}
+
+
+def test_bulk_sample_helper_builds_payload_with_shared_mapping():
+    project = SimpleNamespace(id=uuid.uuid4())
+    sample_data = {"specimen_id": "SPEC-1", "sex": "female", "state_or_region": "x"}
+
+    _, submission = samples._create_sample_with_submission(
+        db=_SampleMutationSession(project=project),
+        bpa_sample_id=None,
+        sample_data=sample_data,
+        taxon_id=1729,
+        kind=samples.SampleKind.SPECIMEN,
+    )
+
+    assert submission.prepared_payload == samples._build_sample_prepared_payload(sample_data)
+    assert submission.project_id == project.id
+
+
+def test_update_sample_replaces_accepted_submission_with_statements():
+    sample_id = uuid.uuid4()
+    submission = SimpleNamespace(
+        id=uuid.uuid4(),
+        sample_id=sample_id,
+        status="accepted",
+        authority="ENA",
+        accession="ERS000001",
+        biosample_accession="SAMEA000001",
+        prepared_payload={},
+    )
+    project = SimpleNamespace(id=uuid.uuid4())
+    db = _SampleMutationSession(
+        sample=_stored_sample(sample_id), submission=submission, project=project
+    )
+
+    samples.update_sample(
+        db=db,
+        sample_id=sample_id,
+        sample_in=SampleUpdate(title="new title"),
+        current_user=SimpleNamespace(is_active=True, roles=["admin"], is_superuser=False),
+    )
+
+    update_stmt, insert_stmt = db.executed
+    assert update_stmt.is_update
+    assert update_stmt.compile().params["status"] == "replaced"
+    assert insert_stmt.is_insert
+    params = insert_stmt.compile().params
+    assert params["status"] == "draft"
+    assert params["accession"] == "ERS000001"
+    assert params["project_id"] == project.id
+    assert not any(isinstance(obj, samples.SampleSubmission) for obj in db.added)
+    assert db.committed
+
+
 def test_get_samples_experiments_and_reads_for_specimen():
     client = TestClient(app)
 
@@ -380,6 +641,9 @@ def test_get_samples_experiments_and_reads_for_specimen():
         def filter(self, *_a, **_k):
             return self
 
+        def options(self, *_a):
+            return self
+
         def join(self, *_a, **_k):
             return self
 
@@ -402,23 +666,16 @@ def test_get_samples_experiments_and_reads_for_specimen():
             if self.calls == 3:
                 return _Q([specimen_sample, derived_sample])
             if self.calls == 4:
-                return _Q([experiment_1])
+                return _Q([experiment_1, experiment_2])
             if self.calls == 5:
-                return _Q([read_1])
-            if self.calls == 6:
-                return _Q([])
-            if self.calls == 7:
-                return _Q([experiment_2])
-            if self.calls == 8:
-                return _Q([read_2])
-            if self.calls == 9:
-                return _Q([])
+                return _Q([read_1, read_2])
             return _Q([])
 
+    db = _DB()
     app.dependency_overrides[samples.get_current_active_user] = lambda: SimpleNamespace(
         is_active=True, roles=["admin"], is_superuser=False
     )
-    app.dependency_overrides[samples.get_db] = _override_db(_DB())
+    app.dependency_overrides[samples.get_db] = _override_db(db)
 
     resp = client.get(f"/api/v1/samples/by-specimen/{taxon_id}/{specimen_id}/related")
 
@@ -437,6 +694,8 @@ def test_get_samples_experiments_and_reads_for_specimen():
     assert body["samples"][1]["experiments"][0]["experiment"]["library_layout"] == "PAIRED"
     assert body["samples"][1]["experiments"][0]["reads"][0]["id"] == str(read_2_id)
     assert body["samples"][1]["experiments"][0]["reads"][0]["lane_number"] == "L001"
+    assert body["samples"][1]["experiments"][0]["qc_reads"] == []
+    assert db.calls == 6
 
 
 def test_get_samples_experiments_and_reads_for_specimen_not_found():
@@ -453,6 +712,9 @@ def test_get_samples_experiments_and_reads_for_specimen_not_found():
         def filter(self, *_a, **_k):
             return self
 
+        def options(self, *_a):
+            return self
+
         def first(self):
             return self.value
 
@@ -535,6 +797,9 @@ def test_get_specimen_by_taxid_and_specimen_id_accepts_encoded_path_value():
         def filter(self, *_a, **_k):
             return self
 
+        def options(self, *_a):
+            return self
+
         def first(self):
             return self.value
 
@@ -620,6 +885,9 @@ def test_get_samples_experiments_and_reads_for_specimen_accepts_encoded_path_val
         def filter(self, *_a, **_k):
             return self
 
+        def options(self, *_a):
+            return self
+
         def first(self):
             return self.value if not isinstance(self.value, list) else None
 
@@ -653,3 +921,62 @@ def test_get_samples_experiments_and_reads_for_specimen_accepts_encoded_path_val
     body = resp.json()
     assert body["specimen_id"] == specimen_id
     assert body["samples"][0]["sample"]["specimen_id"] == specimen_id
+
+
+def test_get_sample_submission_by_experiment_package_id_uses_one_query():
+    sample_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    submission = SimpleNamespace(
+        id=uuid.uuid4(),
+        sample_id=sample_id,
+        project_id=uuid.uuid4(),
+        authority="ENA",
+        status="draft",
+        entity_type_const="sample",
+        prepared_payload={},
+        response_payload=None,
+        accession=None,
+        biosample_accession=None,
+        submitted_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    class _Session(_FakeSession):
+        def __init__(self, rows):
+            self.rows = rows
+            self.queries = 0
+
+        def query(self, *_):
+            self.queries += 1
+            return self
+
+        def outerjoin(self, *_a, **_k):
+            return self
+
+        def all(self):
+            return self.rows
+
+    def _call(rows):
+        db = _Session(rows)
+        try:
+            return samples.get_sample_submission_by_experiment_package_id(
+                bpa_package_id="PKG-1",
+                db=db,
+                current_user=SimpleNamespace(is_active=True, roles=["admin"], is_superuser=False),
+            )
+        finally:
+            assert db.queries == 1
+
+    assert _call([SimpleNamespace(sample_id=sample_id, SampleSubmission=submission)]) == [
+        submission
+    ]
+    for rows, detail in (
+        ([], "not found"),
+        ([SimpleNamespace(sample_id=None, SampleSubmission=None)], "no associated sample"),
+        ([SimpleNamespace(sample_id=sample_id, SampleSubmission=None)], "No submission"),
+    ):
+        with pytest.raises(samples.HTTPException) as exc_info:
+            _call(rows)
+        assert exc_info.value.status_code == 404
+        assert detail in exc_info.value.detail
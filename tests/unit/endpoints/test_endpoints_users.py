@@ -120,6 +120,9 @@ class _ListQuery:
     def __init__(self, items):
         self.items = items
 
+    def order_by(self, *_):
+        return self
+
     def offset(self, *_):
         return self
 
@@ -6,12 +6,22 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from sqlalchemy.orm import Session
 
-from app.models.assembly import Assembly
+from app.models.assembly import Assembly, AssemblyRun, AssemblyStageRun
 from app.models.experiment import Experiment
 from app.models.organism import Organism
 from app.models.sample import Sample
-from app.schemas.assembly import AssemblyCreate, AssemblyCreateFromExperiments, AssemblyDataTypes
-from app.services.assembly_service import AssemblyService
+from app.schemas.assembly import (
+    AssemblyCreate,
+    AssemblyCreateFromExperiments,
+    AssemblyDataTypes,
+    AssemblyStageRunFileCreate,
+    AssemblyStageRunUpdate,
+)
+from app.services.assembly_service import (
+    AssemblyRunService,
+    AssemblyService,
+    AssemblyStageRunService,
+)
 
 LONG_READ_SAMPLE_ID = uuid.uuid4()
 HIC_SAMPLE_ID = uuid.uuid4()
@@ -410,3 +420,39 @@ class TestCreateFromIntent:
             )
 
         assert sample_ids == [LONG_READ_SAMPLE_ID]
+
+
+class TestUpdateStageRunFiles:
+    """Tests for replacing a stage run's files."""
+
+    def test_replacement_files_inserted_in_one_statement(self, mock_db):
+        stage_run = AssemblyStageRun(id=uuid.uuid4(), assembly_run_id=uuid.uuid4())
+        files = [
+            AssemblyStageRunFileCreate(
+                storage_type="s3",
+                endpoint="https://s3.example.org",
+                location_root="bucket",
+                location_path=f"run/file-{i}.txt",
+                sha256sum="0" * 64,
+            )
+            for i in range(3)
+        ]
+
+        AssemblyStageRunService(AssemblyStageRun).update_with_files(
+            mock_db, db_obj=stage_run, update_in=AssemblyStageRunUpdate(files=files)
+        )
+
+        mock_db.add.assert_not_called()
+        mock_db.execute.assert_called_once()
+        rows = mock_db.execute.call_args.args[1]
+        assert [row["location_path"] for row in rows] == [f.location_path for f in files]
+        assert {row["assembly_stage_run_id"] for row in rows} == {stage_run.id}
+
+
+def test_get_runs_by_assembly_id_eager_loads_stage_runs_and_files(mock_db):
+    AssemblyRunService(AssemblyRun).get_by_assembly_id(mock_db, assembly_id=uuid.uuid4())
+
+    (option,) = mock_db.query.return_value.options.call_args.args
+    path = str(option.path)
+    assert "AssemblyRun.stage_runs" in path
+    assert "AssemblyStageRun.files" in path
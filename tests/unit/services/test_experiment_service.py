@@ -136,3 +136,11 @@ def test_update_experiment_updates_current_submission_payload_in_place():
     assert draft_submission.status == "draft"
     assert draft_submission.prepared_payload["design_description"] == "Existing design"
     assert draft_submission.prepared_payload["library_strategy"] == "WGS"
+
+
+def test_build_prepared_payload_maps_non_null_fields():
+    payload = experiment_service._build_prepared_payload(
+        {"bpa_package_id": "pkg-1", "library_strategy": None, "unmapped": "x"}
+    )
+
+    assert payload == {"alias": "pkg-1"}
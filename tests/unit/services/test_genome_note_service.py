@@ -318,6 +318,9 @@ class TestGetByFilters:
             def filter(self, *_args, **_kwargs):
                 return self
 
+            def order_by(self, *_args):
+                return self
+
             def offset(self, *_args, **_kwargs):
                 return self
 
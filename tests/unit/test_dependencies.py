@@ -1,9 +1,9 @@
 import types
 import uuid
 
+import jwt
 import pytest
 from fastapi import HTTPException
-from jose import jwt
 
 from app.core import dependencies
 from app.core.settings import settings
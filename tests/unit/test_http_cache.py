@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import Response
+from starlette.requests import Request
+
+from app.core import http_cache
+
+
+def _request(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def _row(updated_at):
+    return SimpleNamespace(id=uuid.UUID(int=1), updated_at=updated_at)
+
+
+def test_compute_etag_changes_with_updated_at():
+    first = http_cache.compute_etag([_row(datetime(2026, 1, 1, tzinfo=timezone.utc))])
+    second = http_cache.compute_etag([_row(datetime(2026, 1, 2, tzinfo=timezone.utc))])
+
+    assert first.startswith('"') and first.endswith('"')
+    assert first != second
+
+
+def test_conditional_response_sets_headers_on_miss():
+    response = Response()
+
+    out = http_cache.conditional_response(_request(), response, '"abc"')
+
+    assert out is None
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == http_cache.CACHE_CONTROL
+
+
+def test_conditional_response_returns_304_on_match():
+    request = _request({"If-None-Match": 'W/"zzz", "abc"'})
+
+    out = http_cache.conditional_response(request, Response(), '"abc"')
+
+    assert out.status_code == 304
+    assert out.headers["etag"] == '"abc"'
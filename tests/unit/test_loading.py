@@ -0,0 +1,22 @@
+from sqlalchemy.orm import selectinload
+
+from app.db import loading
+from app.models.qc_read import QcRead
+
+
+def test_list_load_options_adds_raiseload_outside_prod(monkeypatch):
+    monkeypatch.setattr(loading.settings, "ENVIRONMENT", "dev")
+    eager = selectinload(QcRead.files)
+
+    options = loading.list_load_options(eager)
+
+    assert options[0] is eager
+    assert len(options) == 2
+    assert options[1].strategy == (("lazy", "raise"),)
+
+
+def test_list_load_options_passes_through_in_prod(monkeypatch):
+    monkeypatch.setattr(loading.settings, "ENVIRONMENT", "prod")
+    eager = selectinload(QcRead.files)
+
+    assert loading.list_load_options(eager) == (eager,)
@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Query
+
+from app.core.pagination import Pagination, apply_pagination
+from app.main import app
+from app.models.organism import Organism
+from app.models.sample import Sample, SampleSubmission
+
+
+def _query_params(path: str):
+    operation = app.openapi()["paths"][path]["get"]
+    return {param["name"] for param in operation.get("parameters", []) if param["in"] == "query"}
+
+
+def test_apply_pagination_uses_offset_without_cursor():
+    statement = apply_pagination(select(Sample), Pagination(offset=20, limit=10))
+
+    sql = str(statement)
+    assert "LIMIT" in sql
+    assert "OFFSET" in sql
+    assert "sample.id >" not in sql
+
+
+def test_apply_pagination_keyset_pages_are_ordered_by_key_and_chain():
+    first = apply_pagination(
+        select(Sample.id, Sample.taxon_id),
+        Pagination(offset=0, limit=10, keyset=True),
+        key=Sample.id,
+    )
+    first_sql = str(first)
+    assert "WHERE" not in first_sql
+    assert "ORDER BY sample.id" in first_sql
+
+    # The last id of the first page is the cursor for the second
+    after = uuid.uuid4()
+    second = apply_pagination(
+        select(Sample.id, Sample.taxon_id),
+        Pagination(offset=0, limit=10, after=after, keyset=True),
+        key=Sample.id,
+    )
+    second_sql = str(second)
+    assert "WHERE sample.id > " in second_sql
+    assert second_sql.endswith("ORDER BY sample.id\n LIMIT :param_1")
+    assert "OFFSET" not in second_sql
+    assert second.compile().params["id_1"] == after
+
+
+def test_apply_pagination_keyset_on_orm_query():
+    after = uuid.uuid4()
+    query = apply_pagination(
+        Query(SampleSubmission),
+        Pagination(offset=0, limit=5, after=after, keyset=True),
+        key=SampleSubmission.id,
+    )
+
+    sql = str(query)
+    assert "WHERE sample_submission.id > " in sql
+    assert "ORDER BY sample_submission.id" in sql
+
+
+def test_apply_pagination_keyset_requires_key():
+    with pytest.raises(ValueError):
+        apply_pagination(select(Sample), Pagination(offset=0, limit=10, keyset=True))
+
+
+def test_apply_pagination_ignores_cursor_outside_keyset_mode():
+    query = apply_pagination(Query(Organism), Pagination(offset=0, limit=5, after=uuid.uuid4()))
+
+    sql = str(query)
+    assert "organism.taxon_id >" not in sql
+    assert "OFFSET" in sql
+
+
+def test_after_cursor_only_offered_on_uuid_keyed_endpoints():
+    # Integer and text primary keys cannot be compared with a UUID cursor
+    for path in ("/api/v1/organisms/", "/api/v1/taxonomy-info/", "/api/v1/bpa-initiatives/"):
+        params = _query_params(path)
+        assert {"offset", "limit"} <= params
+        assert "after" not in params
+    for path in ("/api/v1/reads/", "/api/v1/samples/", "/api/v1/projects/"):
+        assert "after" in _query_params(path)
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import policy as policy_module
+from app.core.errors import AppError
+from app.core.policy import ACTION_ROLES, POLICY, check_policy
+
+
+def _user(roles, is_superuser=False):
+    return SimpleNamespace(roles=roles, is_superuser=is_superuser)
+
+
+def test_action_roles_mirror_policy():
+    assert ACTION_ROLES.keys() == POLICY.keys()
+    assert ACTION_ROLES["samples:update"] == frozenset({"curator", "admin"})
+
+
+def test_check_policy_allows_any_matching_role():
+    check_policy(_user(["viewer", "curator"]), "samples:update")
+    check_policy(_user([], is_superuser=True), "samples:update")
+
+
+def test_check_policy_rejects_missing_role_and_unknown_action():
+    with pytest.raises(AppError) as exc_info:
+        check_policy(_user(["viewer"]), "samples:update")
+    assert exc_info.value.code == "forbidden"
+
+    with pytest.raises(AppError) as exc_info:
+        check_policy(_user(["admin"]), "samples:unknown")
+    assert exc_info.value.code == "policy_missing"
+
+
+def test_policy_decorator_rejects_undefined_action():
+    with pytest.raises(ValueError):
+        policy_module.policy("samples:unknown")
+
+
+def test_policy_decorator_memoizes_granted_actions_per_user(monkeypatch):
+    calls = []
+
+    def _counting_check(user, action):
+        calls.append(action)
+        check_policy(user, action)
+
+    monkeypatch.setattr(policy_module, "check_policy", _counting_check)
+
+    @policy_module.policy("samples:update")
+    def handler(*, current_user):
+        return "ok"
+
+    user = _user(["curator"])
+    assert handler(current_user=user) == "ok"
+    assert handler(current_user=user) == "ok"
+    assert calls == ["samples:update"]
+
+    handler(current_user=_user(["curator"]))
+    assert len(calls) == 2
+
+
+def test_policy_decorator_does_not_memoize_denials():
+    @policy_module.policy("samples:update")
+    def handler(*, current_user):
+        return "ok"
+
+    user = _user(["viewer"])
+    for _ in range(2):
+        with pytest.raises(AppError):
+            handler(current_user=user)
+    assert "samples:update" not in user._policy_granted
+
+
+def test_policy_decorator_preserves_sync_and_async_endpoints():
+    from inspect import iscoroutinefunction
+
+    @policy_module.policy("samples:update")
+    def sync_handler(*, current_user):
+        return "sync"
+
+    @policy_module.policy("samples:update")
+    async def async_handler(*, current_user):
+        return "async"
+
+    assert not iscoroutinefunction(sync_handler)
+    assert iscoroutinefunction(async_handler)
+    assert sync_handler.__name__ == "sync_handler"
@@ -9,3 +9,20 @@ def test_root_endpoint():
     assert resp.status_code == 200
     body = resp.json()
     assert "message" in body and "docs" in body
+
+
+def test_cors_origins_are_a_frozenset():
+    (cors,) = [m for m in app.user_middleware if m.cls.__name__ == "CORSMiddleware"]
+    assert isinstance(cors.kwargs["allow_origins"], frozenset)
+
+
+def test_validation_error_with_oversized_integer_input_returns_422():
+    client = TestClient(app)
+    resp = client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": 123456789012345678901234567890},
+    )
+    assert resp.status_code == 422
+    body = resp.json()
+    assert body["error"]["code"] == "validation_error"
+    assert body["error"]["details"]["errors"][0]["input"] == 123456789012345678901234567890
@@ -1,7 +1,9 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import jwt
 import pytest
-from jose import jwt
 from passlib.context import CryptContext
 
 from app.core import security
@@ -47,6 +49,20 @@ def test_password_hash_round_trip():
     assert not security.verify_password("wrong", hashed)
 
 
+def test_verify_password_accepts_every_bcrypt_prefix():
+    hashed = security.get_password_hash("secret")
+    for prefix in ("$2a$", "$2b$", "$2y$"):
+        variant = prefix + hashed[4:]
+        assert security.verify_password("secret", variant)
+        assert not security.verify_password("wrong", variant)
+
+
+def test_verify_password_rejects_malformed_hashes():
+    assert not security.verify_password("secret", "")
+    assert not security.verify_password("secret", "plaintext-secret")
+    assert not security.verify_password("secret", "$2b$12$truncated")
+
+
 def test_generate_and_hash_tokens_are_safe_and_deterministic():
     token_a = security.generate_refresh_token(length=16)
     token_b = security.generate_refresh_token(length=16)
@@ -63,6 +79,33 @@ def test_generate_and_hash_tokens_are_safe_and_deterministic():
     assert hashed_a1 != hashed_b
 
 
+def test_hash_token_accepts_bytes_and_differs_from_legacy_hash():
+    token = security.generate_refresh_token()
+
+    assert security.hash_token(token) == security.hash_token(token.encode())
+    assert security.legacy_hash_token(token) == hashlib.sha256(token.encode()).hexdigest()
+    assert security.hash_token(token) != security.legacy_hash_token(token)
+
+
+def test_get_password_hash_uses_configured_cost(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_COST", 4)
+
+    hashed = security.get_password_hash("secret")
+
+    assert hashed.startswith("$2b$04$")
+    assert security.verify_password("secret", hashed)
+
+
+def test_password_helpers_accept_utf8_bytes(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_COST", 4)
+    password = "pässwörd"
+
+    hashed = security.get_password_hash(password.encode("utf-8"))
+
+    assert security.verify_password(password, hashed)
+    assert security.verify_password(password.encode("utf-8"), hashed)
+
+
 def test_bcrypt_truncates_to_72_bytes():
     long_pw = "a" * 80  # >72 bytes
     hashed = security.get_password_hash(long_pw)
@@ -70,3 +113,70 @@ def test_bcrypt_truncates_to_72_bytes():
     # bcrypt uses only the first 72 bytes of the password.
     assert security.verify_password("a" * 72 + "XYZ", hashed)  # trailing chars ignored
     assert not security.verify_password("b" * 80, hashed)
+
+
+def test_decode_access_token_caches_verified_claims(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+    token = security.create_access_token("cached-user")
+    decode_calls = []
+    real_decode = security.jwt.decode
+
+    def _counting_decode(*args, **kwargs):
+        decode_calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", _counting_decode)
+
+    assert security.decode_access_token(token)["sub"] == "cached-user"
+    assert security.decode_access_token(token)["sub"] == "cached-user"
+    assert decode_calls == [token]
+
+
+def test_decode_access_token_returns_independent_copies(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+    token = security.create_access_token("copied-user")
+
+    first = security.decode_access_token(token)
+    first["sub"] = "tampered"
+
+    assert security.decode_access_token(token)["sub"] == "copied-user"
+
+
+def test_decode_access_token_evicts_oldest_entries_when_full(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+    monkeypatch.setattr(security, "_TOKEN_CACHE_MAX_SIZE", 3)
+    tokens = [security.create_access_token(f"user-{i}") for i in range(4)]
+
+    for token in tokens:
+        security.decode_access_token(token)
+
+    # Only the oldest entry makes room; the rest of the cache survives
+    assert len(security._token_cache) == 3
+    oldest = hashlib.sha256(tokens[0].encode()).digest()[:16]
+    assert oldest not in security._token_cache
+
+
+def test_decode_access_token_is_safe_across_threads(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+    monkeypatch.setattr(security, "_TOKEN_CACHE_MAX_SIZE", 8)
+    tokens = [security.create_access_token(f"user-{i}") for i in range(64)]
+
+    def _decode_all(offset):
+        for i in range(len(tokens)):
+            token = tokens[(i + offset) % len(tokens)]
+            assert security.decode_access_token(token)["sub"].startswith("user-")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_decode_all, range(8)))
+
+    assert len(security._token_cache) <= 8
+
+
+def test_decode_access_token_does_not_cache_past_token_expiry(monkeypatch):
+    monkeypatch.setattr(security, "_token_cache", {})
+    token = security.create_access_token("short-lived", expires_delta=timedelta(seconds=5))
+
+    security.decode_access_token(token)
+
+    ((cache_until, _),) = security._token_cache.values()
+    assert cache_until <= security.time.monotonic() + 5